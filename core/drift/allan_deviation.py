@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: allan_deviation.py
+
+import math
+import numpy as np
+def octave_factors(n_phase, min_terms=2):
+    factors = []
+    m = 1
+    while n_phase - 3 * m + 1 >= min_terms:
+        factors.append(m)
+        m *= 2
+    return np.array(factors, dtype=np.int64)
+def frequency_to_phase(y, tau0=1.0):
+    y = np.asarray(y, dtype=float)
+    x = np.empty(len(y) + 1)
+    x[0] = 0.0
+    if len(y):
+        np.cumsum((y - y.mean()) * tau0, out=x[1:])
+    return x
+def _second_differences(x, m):
+    return x[2 * m:] - 2.0 * x[m:-m] + x[:-2 * m]
+def phase_deviations(x, tau0=1.0, factors=None):
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    if factors is None:
+        factors = octave_factors(n)
+    factors = np.asarray(factors, dtype=np.int64)
+    taus = factors * tau0
+    adev = np.full(len(factors), np.nan)
+    mdev = np.full(len(factors), np.nan)
+    adev_terms = np.zeros(len(factors), dtype=np.int64)
+    mdev_terms = np.zeros(len(factors), dtype=np.int64)
+    for i, m in enumerate(factors.tolist()):
+        if n - 2 * m < 1:
+            continue
+        d = _second_differences(x, m)
+        tau = m * tau0
+        adev_terms[i] = len(d)
+        adev[i] = math.sqrt(np.dot(d, d) / (2.0 * tau * tau * len(d)))
+        if n - 3 * m + 1 < 1:
+            continue
+        s = np.empty(len(d) + 1)
+        s[0] = 0.0
+        np.cumsum(d, out=s[1:])
+        inner = s[m:] - s[:-m]
+        mdev_terms[i] = len(inner)
+        mdev[i] = math.sqrt(np.dot(inner, inner) / (2.0 * m * m * tau * tau * len(inner)))
+    return {
+        'tau': taus,
+        'adev': adev,
+        'mdev': mdev,
+        'tdev': taus * mdev / math.sqrt(3.0),
+        'adev_terms': adev_terms,
+        'mdev_terms': mdev_terms
+    }
+def frequency_deviations(y, tau0=1.0, factors=None):
+    return phase_deviations(frequency_to_phase(y, tau0), tau0, factors)
+def drift_deviations(drift_ppm, tau0=1.0, factors=None):
+    return frequency_deviations(np.asarray(drift_ppm, dtype=float) * 1e-6, tau0, factors)
+class StreamingAllanDeviation:
+    def __init__(self, tau0=1.0, octaves=12, scale=1e-6):
+        if octaves < 1:
+            raise ValueError("octaves must be at least 1")
+        self.tau0 = tau0
+        self.scale = scale
+        self.factors = [1 << k for k in range(octaves)]
+        self._size = 2 * self.factors[-1] + 1
+        self.reset()
+    def reset(self):
+        self._phase = [0.0] * self._size
+        self._n = 0
+        self._offset = None
+        self._x = 0.0
+        self._adev_sum = [0.0] * len(self.factors)
+        self._adev_terms = [0] * len(self.factors)
+        self._windows = [[0.0] * m for m in self.factors]
+        self._window_sum = [0.0] * len(self.factors)
+        self._mdev_sum = [0.0] * len(self.factors)
+        self._mdev_terms = [0] * len(self.factors)
+    def push(self, value):
+        y = value * self.scale
+        if self._offset is None:
+            self._offset = y
+        self._x += (y - self._offset) * self.tau0
+        self._n += 1
+        n = self._n
+        size = self._size
+        phase = self._phase
+        x = self._x
+        phase[n % size] = x
+        for i, m in enumerate(self.factors):
+            if n < 2 * m:
+                break
+            d = x - 2.0 * phase[(n - m) % size] + phase[(n - 2 * m) % size]
+            self._adev_sum[i] += d * d
+            k = self._adev_terms[i]
+            self._adev_terms[i] = k + 1
+            window = self._windows[i]
+            slot = k % m
+            self._window_sum[i] += d - window[slot]
+            window[slot] = d
+            if slot == m - 1:
+                self._window_sum[i] = math.fsum(window)
+            if k + 1 >= m:
+                self._mdev_sum[i] += self._window_sum[i] * self._window_sum[i]
+                self._mdev_terms[i] += 1
+    @property
+    def count(self):
+        return self._n
+    def deviations(self):
+        taus = np.array(self.factors, dtype=float) * self.tau0
+        m = np.array(self.factors, dtype=float)
+        adev_terms = np.array(self._adev_terms)
+        mdev_terms = np.array(self._mdev_terms)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            adev = np.sqrt(np.array(self._adev_sum) / (2.0 * taus * taus * adev_terms))
+            mdev = np.sqrt(np.array(self._mdev_sum) / (2.0 * m * m * taus * taus * mdev_terms))
+        adev[adev_terms == 0] = np.nan
+        mdev[mdev_terms == 0] = np.nan
+        return {
+            'tau': taus,
+            'adev': adev,
+            'mdev': mdev,
+            'tdev': taus * mdev / math.sqrt(3.0),
+            'adev_terms': adev_terms,
+            'mdev_terms': mdev_terms
+        }
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: async_collector.py
+
+import asyncio
+import logging
+import signal
+import time
+class AsyncSyncSource:
+    def __init__(self, name, fetch, timeout=1.0, poll_interval=1.0, max_age=None):
+        self.name = name
+        self.fetch = fetch
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.max_age = max_age
+        self.value = None
+        self.updated_at = None
+        self.updates = 0
+        self.timeouts = 0
+        self.failures = 0
+    def latest(self):
+        if self.value is None:
+            return None
+        if self.max_age is not None and time.monotonic() - self.updated_at > self.max_age:
+            return None
+        return self.value
+    async def run(self):
+        while True:
+            started = time.monotonic()
+            try:
+                value = await asyncio.wait_for(self.fetch(), self.timeout)
+                if value is not None:
+                    self.value = value
+                    self.updated_at = time.monotonic()
+                    self.updates += 1
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                logging.warning(f"Sync source {self.name} timed out after {self.timeout}s")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                logging.warning(f"Sync source {self.name} failed: {e}")
+            await asyncio.sleep(max(0.0, self.poll_interval - (time.monotonic() - started)))
+    def get_stats(self):
+        return {
+            'name': self.name,
+            'updates': self.updates,
+            'timeouts': self.timeouts,
+            'failures': self.failures,
+            'age': time.monotonic() - self.updated_at if self.updated_at is not None else None
+        }
+class AsyncDriftCollector:
+    def __init__(self, collector, source=None):
+        self.collector = collector
+        self.source = source
+    async def run(self):
+        collector = self.collector
+        if not collector.started:
+            await asyncio.sleep(collector.settle_time)
+            collector.start(install_signal_handlers=False, settle=False)
+        logging.info(f"Starting async drift collector (Interval: {collector.sample_interval}s)")
+        logging.info(f"Logging to: {collector.log_file}")
+        collector.scheduler.start()
+        try:
+            while collector.running:
+                await collector.scheduler.wait_async()
+                measurement = collector.measure_drift()
+                external_drift = self.source.latest() if self.source is not None else None
+                collector.process_sample(measurement, external_drift)
+        finally:
+            await asyncio.get_running_loop().run_in_executor(None, collector.finish)
+    def stop(self):
+        self.collector.running = False
+async def run_collectors(collectors, sources=()):
+    loop = asyncio.get_running_loop()
+    def stop_all():
+        logging.info("Shutting down async drift collectors")
+        for collector in collectors:
+            collector.stop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop_all)
+        except (NotImplementedError, RuntimeError):
+            pass
+    source_tasks = [asyncio.create_task(source.run(), name=f"sync-source-{source.name}") for source in sources]
+    try:
+        await asyncio.gather(*(collector.run() for collector in collectors))
+    finally:
+        for task in source_tasks:
+            task.cancel()
+        await asyncio.gather(*source_tasks, return_exceptions=True)
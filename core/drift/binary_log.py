@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: binary_log.py
+
+import mmap
+import os
+import struct
+import numpy as np
+MAGIC = b'ZDRL'
+FORMAT_VERSION = 1
+HEADER_FORMAT = '<4sHHQQ'
+HEADER_SIZE = 64
+RECORD_DTYPE = np.dtype([
+    ('timestamp_ns', '<i8'),
+    ('monotonic', '<f8'),
+    ('perf_counter', '<f8'),
+    ('drift_ppm', '<f8'),
+    ('predicted_drift_ppm', '<f8')
+])
+DEFAULT_CAPACITY = 1 << 21
+_WRITTEN_OFFSET = struct.calcsize('<4sHHQ')
+def read_header(path):
+    with open(path, 'rb') as f:
+        raw = f.read(struct.calcsize(HEADER_FORMAT))
+    if len(raw) < struct.calcsize(HEADER_FORMAT):
+        raise ValueError(f"{path}: truncated binary drift log header")
+    magic, version, record_size, capacity, written = struct.unpack(HEADER_FORMAT, raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a binary drift log")
+    if version != FORMAT_VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"{path}: unsupported binary drift log (version {version}, record size {record_size})")
+    return {'version': version, 'record_size': record_size, 'capacity': capacity, 'written': written}
+def read_binary_log(path, ordered=True):
+    header = read_header(path)
+    capacity, written = header['capacity'], header['written']
+    records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(capacity,))
+    if written <= capacity:
+        return records[:written]
+    if not ordered:
+        return records
+    head = written % capacity
+    return np.concatenate((records[head:], records[:head]))
+class BinaryRingLogSink:
+    def __init__(self, path, capacity=DEFAULT_CAPACITY):
+        self.path = path
+        self.capacity = capacity
+        self.written = 0
+        self._file = None
+        self._mmap = None
+        self._records = None
+    def open(self):
+        if os.path.exists(self.path) and os.path.getsize(self.path) >= HEADER_SIZE:
+            header = read_header(self.path)
+            self.capacity = header['capacity']
+            self.written = header['written']
+        else:
+            with open(self.path, 'wb') as f:
+                f.write(struct.pack(HEADER_FORMAT, MAGIC, FORMAT_VERSION, RECORD_DTYPE.itemsize, self.capacity, 0).ljust(HEADER_SIZE, b'\0'))
+                f.truncate(HEADER_SIZE + self.capacity * RECORD_DTYPE.itemsize)
+            self.written = 0
+        self._file = open(self.path, 'r+b')
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._records = np.ndarray((self.capacity,), dtype=RECORD_DTYPE, buffer=self._mmap, offset=HEADER_SIZE)
+    def write_rows(self, rows):
+        batch = np.array([tuple(row) for row in rows], dtype=RECORD_DTYPE)
+        if len(batch) > self.capacity:
+            self.written += len(batch) - self.capacity
+            batch = batch[-self.capacity:]
+        head = self.written % self.capacity
+        first = min(len(batch), self.capacity - head)
+        self._records[head:head + first] = batch[:first]
+        if first < len(batch):
+            self._records[:len(batch) - first] = batch[first:]
+        self.written += len(batch)
+        struct.pack_into('<Q', self._mmap, _WRITTEN_OFFSET, self.written)
+    def flush(self):
+        self._mmap.flush()
+    def close(self):
+        if self._mmap is None:
+            return
+        self._records = None
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.close()
+        self._mmap = None
+        self._file = None
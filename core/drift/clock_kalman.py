@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: clock_kalman.py
+
+import numpy as np
+class ClockKalmanFilter:
+    def __init__(self, states=1, process_noise=0.1, measurement_variance=1.0, dt=1.0, initial_covariance=1.0):
+        if states not in (1, 2, 3):
+            raise ValueError("ClockKalmanFilter supports 1, 2 or 3 states")
+        if np.isscalar(process_noise):
+            process_noise = (process_noise,) * states
+        if len(process_noise) != states:
+            raise ValueError(f"process_noise needs {states} entries")
+        self.states = states
+        self.q = tuple(float(q) for q in process_noise) + (0.0,) * (3 - states)
+        self.r = float(measurement_variance)
+        self.dt = dt
+        self.initial_covariance = initial_covariance
+        self.reset()
+    def reset(self):
+        self.x0 = self.x1 = self.x2 = 0.0
+        p = float(self.initial_covariance)
+        self.p00 = p
+        self.p11 = p if self.states > 1 else 0.0
+        self.p22 = p if self.states > 2 else 0.0
+        self.p01 = self.p02 = self.p12 = 0.0
+        self.innovation = 0.0
+        self.updates = 0
+    def predict(self, dt=None):
+        if self.states == 1:
+            self.p00 += self.q[0]
+            return self.x0
+        a = self.dt if dt is None else dt
+        b = 0.5 * a * a if self.states == 3 else 0.0
+        p00, p01, p02, p11, p12, p22 = self.p00, self.p01, self.p02, self.p11, self.p12, self.p22
+        r00 = p00 + a * p01 + b * p02
+        r01 = p01 + a * p11 + b * p12
+        r02 = p02 + a * p12 + b * p22
+        r11 = p11 + a * p12
+        r12 = p12 + a * p22
+        self.p00 = r00 + a * r01 + b * r02 + self.q[0]
+        self.p01 = r01 + a * r02
+        self.p02 = r02
+        self.p11 = r11 + a * r12 + self.q[1]
+        self.p12 = r12
+        self.p22 = p22 + self.q[2]
+        self.x0 += a * self.x1 + b * self.x2
+        self.x1 += a * self.x2
+        return self.x0
+    def correct(self, measurement):
+        self.updates += 1
+        innovation = measurement - self.x0
+        self.innovation = innovation
+        s = self.p00 + self.r
+        if self.states == 1:
+            k0 = self.p00 / s
+            self.x0 += k0 * innovation
+            self.p00 = (1.0 - k0) * self.p00
+            return self.x0
+        p00, p01, p02 = self.p00, self.p01, self.p02
+        k0, k1, k2 = p00 / s, p01 / s, p02 / s
+        self.x0 += k0 * innovation
+        self.x1 += k1 * innovation
+        self.x2 += k2 * innovation
+        self.p00 = p00 - k0 * p00
+        self.p01 = p01 - k0 * p01
+        self.p02 = p02 - k0 * p02
+        self.p11 -= k1 * p01
+        self.p12 -= k1 * p02
+        self.p22 -= k2 * p02
+        return self.x0
+    def update(self, measurement, dt=None):
+        self.predict(dt)
+        return self.correct(measurement)
+    def filter_many(self, measurements, max_transient=100000):
+        z = np.asarray(measurements, dtype=float)
+        n = len(z)
+        estimates = np.empty(n)
+        if self.states != 1:
+            for i in range(n):
+                estimates[i] = self.update(z[i])
+            return estimates
+        if n == 0:
+            return estimates
+        q, r = self.q[0], self.r
+        x, p = self.x0, self.p00
+        i = 0
+        while i < n:
+            p_pred = p + q
+            k = p_pred / (p_pred + r)
+            prior = x
+            x += k * (z[i] - x)
+            estimates[i] = x
+            i += 1
+            p_next = (1.0 - k) * p_pred
+            converged = p_next == p or i >= max_transient
+            p = p_next
+            if converged:
+                break
+        if i < n:
+            from scipy.signal import lfilter
+            p_pred = p + q
+            k = p_pred / (p_pred + r)
+            estimates[i:], _ = lfilter([k], [1.0, k - 1.0], z[i:], zi=[(1.0 - k) * x])
+            prior = estimates[-2]
+            x = estimates[-1]
+        self.x0 = float(x)
+        self.p00 = p
+        self.innovation = float(z[-1] - prior)
+        self.updates += n
+        return estimates
+    def forecast(self, horizon, dt=None, include_measurement=True):
+        k = np.arange(1, horizon + 1, dtype=float)
+        if self.states == 1:
+            mean = np.full(horizon, self.x0)
+            variance = self.p00 + k * self.q[0]
+        else:
+            step = self.dt if dt is None else dt
+            a = step * k
+            b = 0.5 * a * a if self.states == 3 else np.zeros(horizon)
+            mean = self.x0 + a * self.x1 + b * self.x2
+            variance = (self.p00 + a * a * self.p11 + b * b * self.p22
+                        + 2.0 * (a * self.p01 + b * self.p02 + a * b * self.p12))
+            j = k - 1.0
+            sum_j2 = j * k * (2.0 * k - 1.0) / 6.0
+            sum_j4 = j * k * (2.0 * k - 1.0) * (3.0 * k * k - 3.0 * k - 1.0) / 30.0
+            variance = variance + k * self.q[0] + step ** 2 * sum_j2 * self.q[1] + 0.25 * step ** 4 * sum_j4 * self.q[2]
+        if include_measurement:
+            variance = variance + self.r
+        return mean, variance
+    def get_state(self):
+        return {
+            'states': self.states,
+            'x': [self.x0, self.x1, self.x2],
+            'p': [self.p00, self.p01, self.p02, self.p11, self.p12, self.p22],
+            'innovation': self.innovation,
+            'updates': self.updates
+        }
+    def set_state(self, state):
+        if state['states'] != self.states:
+            raise ValueError(f"Checkpoint has {state['states']} states, filter has {self.states}")
+        self.x0, self.x1, self.x2 = (float(v) for v in state['x'])
+        self.p00, self.p01, self.p02, self.p11, self.p12, self.p22 = (float(v) for v in state['p'])
+        self.innovation = float(state['innovation'])
+        self.updates = int(state['updates'])
+    @property
+    def estimate(self):
+        return self.x0
+    @property
+    def state(self):
+        return np.array((self.x0, self.x1, self.x2)[:self.states])
+    @property
+    def covariance(self):
+        full = np.array((
+            (self.p00, self.p01, self.p02),
+            (self.p01, self.p11, self.p12),
+            (self.p02, self.p12, self.p22)
+        ))
+        return full[:self.states, :self.states]
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: clock_sources.py
+
+import time
+from functools import partial
+import numpy as np
+CLOCK_SOURCES = (
+    ('monotonic', None),
+    ('monotonic_raw', 'CLOCK_MONOTONIC_RAW'),
+    ('realtime', 'CLOCK_REALTIME'),
+    ('boottime', 'CLOCK_BOOTTIME'),
+    ('tai', 'CLOCK_TAI'),
+    ('perf_counter', None)
+)
+_NS_READERS = {
+    'monotonic': time.monotonic_ns,
+    'perf_counter': time.perf_counter_ns
+}
+def available_clock_sources(names=None):
+    sources = []
+    for name, clock_attr in CLOCK_SOURCES:
+        if names is not None and name not in names:
+            continue
+        if clock_attr is None:
+            sources.append((name, _NS_READERS[name]))
+            continue
+        clock_id = getattr(time, clock_attr, None)
+        if clock_id is None:
+            continue
+        try:
+            time.clock_gettime_ns(clock_id)
+        except OSError:
+            continue
+        sources.append((name, partial(time.clock_gettime_ns, clock_id)))
+    return sources
+class MultiClockSampler:
+    def __init__(self, names=None):
+        sources = available_clock_sources(names)
+        if len(sources) < 2:
+            raise ValueError("Multi-clock sampling needs at least two readable clocks")
+        self.names = [name for name, _ in sources]
+        self._readers = [reader for _, reader in sources]
+        count = len(self._readers)
+        self._forward = list(enumerate(self._readers))
+        self._reverse = self._forward[::-1]
+        self._values = [0] * count
+        self._i, self._j = np.triu_indices(count, 1)
+        self.pair_names = [f"{self.names[i]}/{self.names[j]}" for i, j in zip(self._i, self._j)]
+        self.ticks = 0
+        self.reset()
+    def reset(self):
+        self._start = np.array(self._read(), dtype=np.int64)
+    def _read(self):
+        values = self._values
+        for index, reader in (self._forward if self.ticks % 2 == 0 else self._reverse):
+            values[index] = reader()
+        self.ticks += 1
+        return values
+    def index(self, name):
+        return self.names.index(name)
+    def pair_index(self, name, reference):
+        return self.pair_names.index(f"{name}/{reference}")
+    def sample(self):
+        elapsed_ns = np.array(self._read(), dtype=np.int64) - self._start
+        reference_ns = elapsed_ns[self._j]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drift_ppm = np.where(reference_ns > 0, 1e6 * (elapsed_ns[self._i] - reference_ns) / reference_ns, 0.0)
+        return elapsed_ns, drift_ppm
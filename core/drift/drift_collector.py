@@ -32,40 +32,116 @@
 
 import time
 import numpy as np
-import csv
 import signal
 import logging
+import threading
 from datetime import datetime
 import os
 import platform
 from .drift_predictor import DriftPredictor
+from .log_writer import BatchedLogWriter, CsvLogSink
+from .log_rotation import RotatingCsvLogSink
+from .binary_log import BinaryRingLogSink, DEFAULT_CAPACITY
+from .scheduler import DeadlineScheduler, HYBRID_SPIN_THRESHOLD
+from .clock_sources import MultiClockSampler
+from .online_stats import SlidingWindowStats
+from .allan_deviation import StreamingAllanDeviation
+from .predictor_checkpoint import PeriodicCheckpointer, restore_checkpoint
 SAMPLE_INTERVAL = 0.1  
+SPIN_THRESHOLD = 0.0
 BUFFER_SIZE = 6000     
 LOG_DIR = "logs"
+LOG_HEADER = ['timestamp', 'monotonic', 'perf_counter', 'drift_ppm', 'predicted_drift_ppm']
+LOG_QUEUE_SIZE = 4096
+LOG_BATCH_SIZE = 256
+LOG_FLUSH_INTERVAL = 1.0
+LOG_FORMAT = "csv"
+LOG_ROTATE_BYTES = None
+LOG_ROTATE_SECONDS = None
+LOG_RETAIN_SEGMENTS = None
+BINARY_LOG_CAPACITY = DEFAULT_CAPACITY
 DEBUG_MODE = True
 WARMUP_SAMPLES = 5     
-os.makedirs(LOG_DIR, exist_ok=True)
+SETTLE_TIME = 1.0
+CHECKPOINT_INTERVAL = 60.0
+def configure_logging(debug=DEBUG_MODE):
+    logging.basicConfig(
+        level=logging.DEBUG if debug else logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
 class DriftCollector:
-    def __init__(self, external_sync_fn=None):
-        time.sleep(1)
+    def __init__(self, external_sync_fn=None, log_format=LOG_FORMAT, sample_interval=SAMPLE_INTERVAL, spin_threshold=SPIN_THRESHOLD, multi_clock=False,
+                 rotate_bytes=LOG_ROTATE_BYTES, rotate_seconds=LOG_ROTATE_SECONDS, retain_segments=LOG_RETAIN_SEGMENTS,
+                 log_tag=None, settle_time=SETTLE_TIME, predictor=None, checkpoint_path=None, checkpoint_interval=CHECKPOINT_INTERVAL,
+                 allan_octaves=None):
+        self.settle_time = settle_time
+        self.started = False
         self.reference_start = time.perf_counter()
         self.monotonic_start = time.monotonic()
-        self.drift_buffer = np.zeros(BUFFER_SIZE)
+        self.drift_stats = SlidingWindowStats(BUFFER_SIZE)
         self.index = 0
+        self.sample_count = 0
+        self.warmup_samples = 10
         self.running = True
-        self.log_file = os.path.join(LOG_DIR, f"drift_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
-        self.predictor = DriftPredictor(model_type='kalman')  
+        self.sample_interval = sample_interval
+        self.scheduler = DeadlineScheduler(sample_interval, spin_threshold=spin_threshold)
+        if log_format not in ("csv", "binary"):
+            raise ValueError(f"Unsupported log format: {log_format}")
+        if log_format == "binary" and multi_clock:
+            raise ValueError("Binary log format does not record per-pair clock drift; use log_format='csv' with multi_clock")
+        if log_format == "binary" and (rotate_bytes is not None or rotate_seconds is not None):
+            raise ValueError("Binary log format is a fixed-size ring and does not rotate; drop rotate_bytes/rotate_seconds")
+        self.log_format = log_format
+        extension = "bin" if log_format == "binary" else "csv"
+        suffix = f"_{log_tag}" if log_tag else ""
+        self.log_file = os.path.join(LOG_DIR, f"drift_{datetime.now().strftime('%Y%m%d_%H%M%S')}{suffix}.{extension}")
+        self.clock_sampler = MultiClockSampler() if multi_clock else None
+        self.allan = StreamingAllanDeviation(sample_interval, allan_octaves, scale=1.0) if allan_octaves else None
+        self._last_phase = None
+        self.predictor = predictor if predictor is not None else DriftPredictor(model_type='kalman')
         self.external_sync_fn = external_sync_fn  
-        logging.basicConfig(
-            level=logging.DEBUG if DEBUG_MODE else logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
+        self.checkpoint_path = checkpoint_path
+        self.checkpointer = PeriodicCheckpointer(checkpoint_path, self.predictor, checkpoint_interval, background=True) if checkpoint_path else None
+        if log_format == "binary":
+            sink = BinaryRingLogSink(self.log_file, capacity=BINARY_LOG_CAPACITY)
+        else:
+            header = LOG_HEADER
+            if self.clock_sampler is not None:
+                header = header + [f"drift_ppm[{pair}]" for pair in self.clock_sampler.pair_names]
+            if rotate_bytes is not None or rotate_seconds is not None:
+                sink = RotatingCsvLogSink(self.log_file, header, max_bytes=rotate_bytes,
+                                          max_seconds=rotate_seconds, max_segments=retain_segments)
+                self.log_file = sink.manifest_path
+            else:
+                sink = CsvLogSink(self.log_file, header)
+        self.log_writer = BatchedLogWriter(
+            sink,
+            max_queue=LOG_QUEUE_SIZE,
+            batch_size=LOG_BATCH_SIZE,
+            flush_interval=LOG_FLUSH_INTERVAL
         )
-        signal.signal(signal.SIGINT, self.safe_exit)
-        signal.signal(signal.SIGTERM, self.safe_exit)
+    def start(self, install_signal_handlers=True, settle=True):
+        if self.started:
+            return self
+        self.started = True
+        log_dir = os.path.dirname(self.log_file)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+        if install_signal_handlers and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self.safe_exit)
+            signal.signal(signal.SIGTERM, self.safe_exit)
         self.log_system_info()
-        with open(self.log_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['timestamp', 'monotonic', 'perf_counter', 'drift_ppm', 'predicted_drift_ppm'])
+        if settle and self.settle_time > 0:
+            time.sleep(self.settle_time)
+        self.reference_start = time.perf_counter()
+        self.monotonic_start = time.monotonic()
+        self._last_phase = None
+        if self.clock_sampler is not None:
+            self.clock_sampler.reset()
+        if self.checkpoint_path:
+            restore_checkpoint(self.checkpoint_path, self.predictor)
+        self.log_writer.start()
+        return self
     def log_system_info(self):
         logging.info(f"System: {platform.system()} {platform.release()}")
         logging.info(f"Processor: {platform.processor()}")
@@ -81,6 +157,8 @@ class DriftCollector:
         except:
             return "Unknown"
     def measure_drift(self):
+        if self.clock_sampler is not None:
+            return self.measure_multi_clock_drift()
         monotonic_current = time.monotonic() - self.monotonic_start
         perf_current = time.perf_counter() - self.reference_start
         expected = perf_current
@@ -90,59 +168,110 @@ class DriftCollector:
             drift_ppm = 0
         return {
             'timestamp': datetime.utcnow().isoformat(),
+            'timestamp_ns': time.time_ns(),
             'monotonic': monotonic_current,
             'perf_counter': perf_current,
             'drift_ppm': drift_ppm
         }
+    def measure_multi_clock_drift(self):
+        sampler = self.clock_sampler
+        timestamp_ns = time.time_ns()
+        elapsed_ns, pair_drift_ppm = sampler.sample()
+        drift_ppm = pair_drift_ppm[sampler.pair_index('monotonic', 'perf_counter')]
+        if abs(drift_ppm) > 100:
+            drift_ppm = 0
+        return {
+            'timestamp': datetime.utcfromtimestamp(timestamp_ns / 1e9).isoformat(),
+            'timestamp_ns': timestamp_ns,
+            'monotonic': elapsed_ns[sampler.index('monotonic')] / 1e9,
+            'perf_counter': elapsed_ns[sampler.index('perf_counter')] / 1e9,
+            'drift_ppm': float(drift_ppm),
+            'clock_elapsed_ns': elapsed_ns,
+            'clock_drift_ppm': pair_drift_ppm
+        }
+    def get_drift_stats(self):
+        return self.drift_stats.snapshot()
+    def get_allan_deviation(self):
+        return self.allan.deviations() if self.allan is not None else None
     def safe_exit(self, signum, frame):
         logging.info("Shutting down drift collector")
         self.running = False
+        self.log_writer.close()
+    def read_external_drift(self):
+        if self.external_sync_fn is None:
+            return None
+        try:
+            return self.external_sync_fn()
+        except Exception as e:
+            logging.warning(f"External sync input failed: {e}")
+            return None
+    def process_sample(self, measurement, external_drift=None):
+        phase = measurement['monotonic'] - measurement['perf_counter']
+        previous_phase, self._last_phase = self._last_phase, phase
+        self.sample_count += 1
+        if self.sample_count <= self.warmup_samples:
+            return None
+        drift = measurement['drift_ppm']
+        drift_input = external_drift if external_drift is not None else drift
+        self.drift_stats.push(drift_input)
+        self.index = (self.index + 1) % BUFFER_SIZE
+        if self.allan is not None and previous_phase is not None:
+            self.allan.push((phase - previous_phase) / self.sample_interval)
+        self.predictor.update(drift_input)
+        predicted_drift = self.predictor.predict()
+        if self.checkpointer is not None:
+            self.checkpointer.maybe_save()
+        row = [
+            measurement['timestamp_ns'] if self.log_format == "binary" else measurement['timestamp'],
+            measurement['monotonic'],
+            measurement['perf_counter'],
+            drift_input,
+            predicted_drift
+        ]
+        if self.log_format == "csv" and 'clock_drift_ppm' in measurement:
+            row.extend(measurement['clock_drift_ppm'].tolist())
+        self.log_writer.submit(row)
+        if self.index == 0:
+            stats = self.get_drift_stats()
+            logging.debug(f"Drift Stats: μ={stats['mean']:.2f}ppm σ={stats['std']:.2f} "
+                          f"Range=[{stats['min']:.2f}, {stats['max']:.2f}] "
+                          f"Predictor: {predicted_drift:.2f}ppm")
+        return predicted_drift
     def run(self):
-        logging.info(f"Starting Drift Measurement Core (Interval: {SAMPLE_INTERVAL}s)")
+        self.start()
+        logging.info(f"Starting Drift Measurement Core (Interval: {self.sample_interval}s)")
         logging.info(f"Logging to: {self.log_file}")
-        WARMUP_SAMPLES = 10
-        sample_count = 0
+        self.scheduler.start()
         while self.running:
-            start_time = time.perf_counter()
+            self.scheduler.wait()
             measurement = self.measure_drift()
-            sample_count += 1
-            if sample_count <= WARMUP_SAMPLES:
-                continue  
-            drift = measurement['drift_ppm']
-            external_drift = None
-            if self.external_sync_fn is not None:
-                try:
-                    external_drift = self.external_sync_fn()
-                except Exception as e:
-                    logging.warning(f"External sync input failed: {e}")
-            drift_input = external_drift if external_drift is not None else drift
-            self.drift_buffer[self.index] = drift_input
-            self.index = (self.index + 1) % BUFFER_SIZE
-            self.predictor.update(drift_input)
-            predicted_drift = self.predictor.predict()
-            with open(self.log_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    measurement['timestamp'],
-                    measurement['monotonic'],
-                    measurement['perf_counter'],
-                    drift_input,
-                    predicted_drift
-                ])
-            if self.index == 0:
-                window = self.drift_buffer
-                stats = {
-                    'mean': np.mean(window),
-                    'std': np.std(window),
-                    'min': np.min(window),
-                    'max': np.max(window)
-                }
-                logging.debug(f"Drift Stats: μ={stats['mean']:.2f}ppm σ={stats['std']:.2f} "
-                              f"Range=[{stats['min']:.2f}, {stats['max']:.2f}] "
-                              f"Predictor: {predicted_drift:.2f}ppm")
-            elapsed = time.perf_counter() - start_time
-            sleep_time = max(0, SAMPLE_INTERVAL - elapsed)
-            time.sleep(sleep_time)
+            external_drift = self.read_external_drift() if self.sample_count >= self.warmup_samples else None
+            self.process_sample(measurement, external_drift)
+        self.finish()
+    def finish(self):
+        self.log_writer.close()
+        if self.checkpointer is not None:
+            self.checkpointer.close()
+            self.checkpointer.save()
+        stats = self.log_writer.get_stats()
+        logging.info(f"Log writer: {stats['written']} written, {stats['dropped']} dropped, {stats['late']} late")
+        sched = self.scheduler.get_stats()
+        logging.info(f"Scheduler: {sched['ticks']} ticks, {sched['missed']} missed deadlines, "
+                     f"lateness mean={sched['mean_lateness_us']:.1f}us max={sched['max_lateness_us']:.1f}us")
+        logging.debug(f"Scheduler lateness histogram: {sched['histogram_us']}")
+        if self.allan is not None:
+            curve = self.allan.deviations()
+            for tau, adev, mdev, tdev in zip(curve['tau'], curve['adev'], curve['mdev'], curve['tdev']):
+                if not np.isnan(adev):
+                    logging.info(f"tau={tau:.4g}s ADEV={adev:.3e} MDEV={mdev:.3e} TDEV={tdev:.3e}s")
 if __name__ == "__main__":
-    collector = DriftCollector()
+    import argparse
+    parser = argparse.ArgumentParser(description="Collect clock drift samples")
+    parser.add_argument("--interval", type=float, default=SAMPLE_INTERVAL, help="Sample interval in seconds")
+    parser.add_argument("--hybrid-spin", action="store_true",
+                        help=f"Sleep until {HYBRID_SPIN_THRESHOLD * 1e6:.0f}us before each deadline, then spin")
+    args = parser.parse_args()
+    configure_logging()
+    collector = DriftCollector(sample_interval=args.interval,
+                               spin_threshold=HYBRID_SPIN_THRESHOLD if args.hybrid_spin else SPIN_THRESHOLD)
     collector.run()
\ No newline at end of file
@@ -31,101 +31,292 @@
 # File: drift_predictor.py
 
 import numpy as np
-from scipy.linalg import inv
 from collections import deque
+import math
+from .online_stats import SlidingWindowStats, LagOneSums, SlidingLinearRegression, SlidingAutocorrelation
+from .clock_kalman import ClockKalmanFilter
+from .thermal_model import ThermalDriftModel
+_MODEL_NONE, _MODEL_AR1, _MODEL_LINEAR = 0, 1, 2
+_MODEL_CODES = {None: _MODEL_NONE, 'ar1': _MODEL_AR1, 'linear': _MODEL_LINEAR}
+_MODEL_NAMES = {code: name for name, code in _MODEL_CODES.items()}
+HARDWARE_THERMAL_POLYNOMIAL = (0.0, 0.0, 0.0005)
+HARDWARE_AGING_PPM = 0.01
+MIN_SELECTION_SAMPLES = 10
+MAX_FORECAST_PHI = 0.999
+def _sliding_autocorr(series, ends, counts, window, lag, tolerance=1e-12, chunk=16384):
+    pad = window - 1
+    view = np.lib.stride_tricks.sliding_window_view(np.concatenate((np.zeros(pad), series)), window)
+    positions = np.arange(window)
+    out = np.zeros(len(ends))
+    for start in range(0, len(ends), chunk):
+        rows = ends[start:start + chunk]
+        n = counts[start:start + chunk]
+        mask = positions >= (window - n)[:, None]
+        values = np.where(mask, view[rows], 0.0)
+        dev = np.where(mask, values - values.sum(axis=1, keepdims=True) / n[:, None], 0.0)
+        denom = (dev * dev).sum(axis=1)
+        numer = (dev[:, :-lag] * dev[:, lag:]).sum(axis=1)
+        varying = (denom > tolerance * (values * values).sum(axis=1)) & (n > lag)
+        out[start:start + chunk] = np.where(varying, numer / np.where(varying, denom, 1.0), 0.0)
+    return out
+def _hysteresis_models(autocorr, ready, initial_model, threshold, hysteresis):
+    decision = np.where(autocorr > threshold, _MODEL_AR1, np.where(autocorr < threshold - hysteresis, _MODEL_LINEAR, _MODEL_NONE))
+    decision = np.where(ready, decision, _MODEL_NONE)
+    if initial_model == _MODEL_NONE and ready.any():
+        first = np.argmax(ready)
+        if decision[first] == _MODEL_NONE:
+            decision[first] = _MODEL_LINEAR
+    source = np.maximum.accumulate(np.where(decision != _MODEL_NONE, np.arange(len(decision)), -1))
+    return np.where(source >= 0, decision[np.maximum(source, 0)], initial_model)
+def _sliding_linear_predict(times, drifts, ends, counts, window, at, chunk=16384):
+    pad = window - 1
+    times = np.concatenate((np.zeros(pad), times))
+    drifts = np.concatenate((np.zeros(pad), drifts))
+    t_view = np.lib.stride_tricks.sliding_window_view(times, window)
+    d_view = np.lib.stride_tricks.sliding_window_view(drifts, window)
+    positions = np.arange(window)
+    out = np.empty(len(ends))
+    for start in range(0, len(ends), chunk):
+        rows = ends[start:start + chunk]
+        n = counts[start:start + chunk].astype(float)
+        mask = positions >= (window - counts[start:start + chunk])[:, None]
+        t_last = t_view[rows, -1]
+        t = np.where(mask, t_view[rows] - t_last[:, None], 0.0)
+        d = np.where(mask, d_view[rows], 0.0)
+        st, sd = t.sum(axis=1), d.sum(axis=1)
+        stt, std = (t * t).sum(axis=1), (t * d).sum(axis=1)
+        den = n * stt - st * st
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = np.where(den != 0, (n * std - st * sd) / den, 0.0)
+        intercept = (sd - slope * st) / n
+        out[start:start + chunk] = slope * (at[start:start + chunk] - t_last) + intercept
+    return out
 class DriftPredictor:
-    def __init__(self, model_type='ar1', process_variance=0.1, measurement_variance=1.0, phi_window=10, window_size=50, autocorr_threshold=0.9):
+    def __init__(self, model_type='ar1', process_variance=0.1, measurement_variance=1.0, phi_window=10, window_size=50, autocorr_threshold=0.9, stats_window=1000, kalman_states=1, autocorr_lag=1, autocorr_hysteresis=0.05):
         self.model_type = model_type
-        self.history = []
+        self.history = deque(maxlen=phi_window + 1)
+        self.update_count = 0
+        self._lag_sums = LagOneSums(phi_window - 1)
+        self.stats = SlidingWindowStats(stats_window)
         self.last_prediction = 0.0
         self.phi_window = phi_window  
         self._phi = 0.0  
-        self.state = np.array([0.0])  
-        self.covariance = np.eye(1)   
-        self.A = np.eye(1)            
-        self.H = np.eye(1)            
-        self.Q = np.eye(1) * process_variance  
-        self.R = np.eye(1) * measurement_variance  
+        self.kalman = ClockKalmanFilter(kalman_states, process_variance, measurement_variance)
         self.window_size = window_size
         self.autocorr_threshold = autocorr_threshold
+        self.autocorr_lag = autocorr_lag
+        self.autocorr_hysteresis = autocorr_hysteresis
+        self.autocorr = SlidingAutocorrelation(window_size, autocorr_lag)
         self.times = deque(maxlen=window_size)
         self.drifts = deque(maxlen=window_size)
+        self.regression = SlidingLinearRegression(window_size)
         self.dynamic_model = None  
     def update(self, drift_measurement, timestamp=None):
         drift_measurement = max(drift_measurement, -70.0)
+        if self.model_type == 'ar1' and len(self.history) > 1:
+            self._lag_sums.push(self.history[-2], self.history[-1])
         self.history.append(drift_measurement)
+        self.update_count += 1
         if self.model_type == 'ar1':
-            if len(self.history) > 2:
-                window = min(self.phi_window, len(self.history) - 1)
-                x_prev = np.array(self.history[-window-1:-1])
-                x_now = np.array(self.history[-window:])
-                denom = np.dot(x_prev, x_prev)
-                if denom != 0 and not np.isnan(denom):
-                    phi = np.dot(x_prev, x_now) / denom
+            if self.update_count > 2:
+                x_prev = self.history[-2]
+                denom = self._lag_sums.sxx + x_prev * x_prev
+                if denom != 0 and not math.isnan(denom):
+                    phi = (self._lag_sums.sxy + x_prev * drift_measurement) / denom
                     phi = max(min(phi, 0.999), -0.999)
                 else:
                     phi = 0.0
                 alpha = 0.5
                 self._phi = alpha * phi + (1 - alpha) * getattr(self, "_phi", phi)
                 self.last_prediction = self._phi * self.history[-1]
-            elif len(self.history) > 1:
+            elif self.update_count > 1:
                 self.last_prediction = self.history[-1]  
         elif self.model_type == 'kalman':
-            self.state = self.A @ self.state
-            self.covariance = self.A @ self.covariance @ self.A.T + self.Q
-            innovation = drift_measurement - self.H @ self.state
-            S = self.H @ self.covariance @ self.H.T + self.R
-            K = self.covariance @ self.H.T @ inv(S)
-            self.state = self.state + K @ innovation
-            self.covariance = (np.eye(1) - K @ self.H) @ self.covariance
-            self.last_prediction = self.state[0]
-        if len(self.history) > 1:
-            std = np.std(self.history)
-            if std > 1.0:
-                mean = np.mean(self.history[:-1])
-                self.history[-1] = mean + np.sign(self.history[-1] - mean) * min(abs(self.history[-1] - mean), 1.0)
+            dt = timestamp - self.times[-1] if timestamp is not None and self.times else None
+            self.last_prediction = self.kalman.update(drift_measurement, dt)
+        self._clip_last()
         if timestamp is not None:
             self.times.append(timestamp)
+            self.regression.push(timestamp, drift_measurement)
         self.drifts.append(drift_measurement)
+        self.autocorr.push(drift_measurement)
         self._select_model()
+    def _clip_last(self):
+        value = self.history[-1]
+        if self.stats.count > 0 and self.stats.std_with(value) > 1.0:
+            mean = self.stats.mean
+            value = mean + np.sign(value - mean) * min(abs(value - mean), 1.0)
+            self.history[-1] = value
+        self.stats.push(value)
+    @property
+    def state(self):
+        return self.kalman.state
+    @property
+    def covariance(self):
+        return self.kalman.covariance
     def _select_model(self):
-        if len(self.drifts) < 10:
+        if self.autocorr.count < MIN_SELECTION_SAMPLES:
             return  
-        series = np.array(self.drifts)
-        mean = np.mean(series)
-        var = np.var(series)
-        if var == 0:
-            autocorr = 0.0
-        else:
-            autocorr = np.correlate(series - mean, series - mean, mode='valid')[0] / (var * len(series))
+        autocorr = self.autocorr.autocorr(self.autocorr_lag)
         if autocorr > self.autocorr_threshold:
             self.dynamic_model = 'ar1'
-        else:
+        elif self.dynamic_model is None or autocorr < self.autocorr_threshold - self.autocorr_hysteresis:
             self.dynamic_model = 'linear'
     def predict(self, steps=1, timestamp=None):
         if len(self.drifts) == 0:
             return 0.0
         if self.dynamic_model == 'ar1' and len(self.drifts) > 1:
             phi = self.drifts[-1] / self.drifts[-2] if self.drifts[-2] != 0 else 1.0
-            pred = self.drifts[-1]
-            for _ in range(steps - 1):
-                pred = phi * pred
-            return pred
-        elif self.dynamic_model == 'linear' and len(self.drifts) > 1 and timestamp is not None:
-            t = np.array(self.times)
-            d = np.array(self.drifts)
-            A = np.vstack([t, np.ones(len(t))]).T
-            slope, intercept = np.linalg.lstsq(A, d, rcond=None)[0]
-            return slope * timestamp + intercept
+            return self.drifts[-1] * phi ** (steps - 1)
+        elif self.dynamic_model == 'linear' and len(self.drifts) > 1 and timestamp is not None and self.regression.count > 0:
+            return self.regression.predict(timestamp)
         return self.drifts[-1]
+    def forecast(self, horizon, timestamps=None, interval=None):
+        k = np.arange(1, horizon + 1, dtype=float)
+        if len(self.drifts) == 0:
+            return np.zeros(horizon), np.full(horizon, np.inf)
+        last = self.drifts[-1]
+        if interval is None and len(self.times) > 1:
+            interval = (self.times[-1] - self.times[0]) / (len(self.times) - 1)
+        if self.dynamic_model == 'linear' and len(self.drifts) > 1 and self.regression.count > 2 and (timestamps is not None or len(self.times) > 1):
+            if timestamps is None:
+                timestamps = self.times[-1] + interval * k
+            timestamps = np.asarray(timestamps, dtype=float)
+            return self.regression.predict(timestamps), self.regression.prediction_variance(timestamps)
+        if self.dynamic_model != 'ar1' and self.model_type == 'kalman' and self.kalman.updates > 0:
+            return self.kalman.forecast(horizon, interval if self.times else None)
+        phi, centre = 1.0, last
+        if self.dynamic_model == 'ar1' and self.autocorr.count > 1:
+            phi = max(min(self.autocorr.autocorr(1), MAX_FORECAST_PHI), -MAX_FORECAST_PHI)
+            centre = self.autocorr.s1 / self.autocorr.count
+        mean = centre + phi ** k * (last - centre)
+        sigma2 = self.autocorr.innovation_variance(phi, centre)
+        phi2 = phi * phi
+        if abs(1.0 - phi2) < 1e-12:
+            return mean, sigma2 * k
+        return mean, sigma2 * (1.0 - phi2 ** k) / (1.0 - phi2)
+    def update_many(self, drifts, timestamps=None):
+        z = np.maximum(np.asarray(drifts, dtype=float), -70.0)
+        n = len(z)
+        if timestamps is not None and len(timestamps) != n:
+            raise ValueError("timestamps length must match drifts length")
+        tail = self.stats.window + self.phi_window + 1
+        if self.model_type == 'kalman' and self.kalman.states == 1 and n > tail:
+            predictions = self.kalman.filter_many(z)
+            self.history.clear()
+            self.stats.reset()
+            for value in z[-tail:]:
+                self.history.append(float(value))
+                self._clip_last()
+            self.update_count += n
+            self.last_prediction = float(predictions[-1])
+            if timestamps is not None:
+                recent_times = np.asarray(timestamps[-self.window_size:], dtype=float).tolist()
+                self.times.extend(recent_times)
+                for t, d in zip(recent_times, z[-self.window_size:].tolist()):
+                    self.regression.push(t, d)
+            prior_drifts = np.array(self.drifts, dtype=float)
+            self.drifts.extend(z[-self.window_size:].tolist())
+            series = np.concatenate((prior_drifts, z))
+            ends = len(prior_drifts) + np.arange(n)
+            counts = np.minimum(ends + 1, self.window_size)
+            models = self._dynamic_models_many(series, ends, counts, _MODEL_CODES[self.dynamic_model])
+            self.dynamic_model = _MODEL_NAMES[int(models[-1])]
+            self.autocorr.reset()
+            for value in z[-self.window_size:].tolist():
+                self.autocorr.push(value)
+        else:
+            predictions = np.empty(n)
+            for i in range(n):
+                DriftPredictor.update(self, float(z[i]), None if timestamps is None else timestamps[i])
+                predictions[i] = self.last_prediction
+        return predictions, z - predictions
+    def predict_many(self, drifts, timestamps=None, steps=1, predict_timestamps=None):
+        z = np.maximum(np.asarray(drifts, dtype=float), -70.0)
+        n = len(z)
+        prior_drifts = np.array(self.drifts, dtype=float)
+        prior_times = np.array(self.times, dtype=float)
+        initial_model = _MODEL_CODES[self.dynamic_model]
+        if predict_timestamps is not None and (timestamps is None or len(prior_times) != len(prior_drifts)):
+            predictions = np.empty(n)
+            for i in range(n):
+                DriftPredictor.update(self, float(z[i]), None if timestamps is None else timestamps[i])
+                predictions[i] = self.predict(steps, predict_timestamps[i])
+        else:
+            self.update_many(z, timestamps)
+            series = np.concatenate((prior_drifts, z))
+            ends = len(prior_drifts) + np.arange(n)
+            counts = np.minimum(ends + 1, self.window_size)
+            models = self._dynamic_models_many(series, ends, counts, initial_model)
+            last = series[ends]
+            previous = series[np.maximum(ends - 1, 0)]
+            nonzero = previous != 0
+            phi = np.where(nonzero, last / np.where(nonzero, previous, 1.0), 1.0)
+            ar1_predictions = last * phi ** (steps - 1)
+            predictions = last.copy()
+            ar1 = (models == _MODEL_AR1) & (counts > 1)
+            predictions[ar1] = ar1_predictions[ar1]
+            if predict_timestamps is not None:
+                linear = (models == _MODEL_LINEAR) & (counts > 1)
+                times = np.concatenate((prior_times, np.asarray(timestamps, dtype=float)))
+                predictions[linear] = _sliding_linear_predict(
+                    times, series, ends[linear], counts[linear], self.window_size,
+                    np.asarray(predict_timestamps, dtype=float)[linear]
+                )
+        residuals = np.full(n, np.nan)
+        if steps < n:
+            residuals[:n - steps] = z[steps:] - predictions[:n - steps]
+        return predictions, residuals
+    def _dynamic_models_many(self, series, ends, counts, initial_model):
+        autocorr = _sliding_autocorr(series, ends, counts, self.window_size, self.autocorr_lag)
+        return _hysteresis_models(autocorr, counts >= MIN_SELECTION_SAMPLES, initial_model, self.autocorr_threshold, self.autocorr_hysteresis)
     def reset(self):
-        self.history = []
-        self.state = np.array([0.0])
-        self.covariance = np.eye(1)
+        self.history.clear()
+        self.update_count = 0
+        self._lag_sums.reset()
+        self.stats.reset()
+        self.kalman.reset()
         self.last_prediction = 0.0
         self.times.clear()
         self.drifts.clear()
+        self.regression.reset()
+        self.autocorr.reset()
         self.dynamic_model = None
+    def get_state(self):
+        return {
+            'model_type': self.model_type,
+            'update_count': self.update_count,
+            'last_prediction': float(self.last_prediction),
+            'phi': float(self._phi),
+            'dynamic_model': self.dynamic_model,
+            'history': [float(v) for v in self.history],
+            'lag_pairs': [[float(a), float(b)] for a, b in self._lag_sums.pairs()],
+            'stats': [float(v) for v in self.stats.values()],
+            'drifts': [float(v) for v in self.drifts],
+            'times': [float(v) for v in self.times],
+            'regression': [[float(t), float(d)] for t, d in self.regression.points()],
+            'kalman': self.kalman.get_state()
+        }
+    def set_state(self, state):
+        if state['model_type'] != self.model_type:
+            raise ValueError(f"Checkpoint is for model {state['model_type']}, predictor uses {self.model_type}")
+        self.reset()
+        self.kalman.set_state(state['kalman'])
+        self.update_count = int(state['update_count'])
+        self.last_prediction = float(state['last_prediction'])
+        self._phi = float(state['phi'])
+        self.history.extend(state['history'])
+        for prev, now in state['lag_pairs']:
+            self._lag_sums.push(prev, now)
+        for value in state['stats']:
+            self.stats.push(value)
+        self.drifts.extend(state['drifts'])
+        for value in self.drifts:
+            self.autocorr.push(value)
+        self.times.extend(state['times'])
+        for t, d in state['regression']:
+            self.regression.push(t, d)
+        self.dynamic_model = state['dynamic_model']
     def apply_correction(self, drift_measurement, interval=1.0):
         self.update(drift_measurement)
         predicted_drift = self.predict()
@@ -155,7 +346,7 @@ class HardwareAwareDriftPredictor(DriftPredictor):
         if self.mode == "WSL":
             return SimulatedDriftModel(self.clock_source)
         if 'temp' in self.hal.sensors:
-            return ThermalDriftModel(self.clock_source)
+            return ThermalDriftModel.load(self.clock_source, mode=self.mode, polynomial=HARDWARE_THERMAL_POLYNOMIAL, aging=HARDWARE_AGING_PPM)
         return BaseDriftModel()
     def get_drift_components(self):
         return {
@@ -167,16 +358,8 @@ class HardwareAwareDriftPredictor(DriftPredictor):
 class BaseDriftModel:
     def compensate(self, raw_drift, env_data):
         return raw_drift
-class ThermalDriftModel(BaseDriftModel):
-    def __init__(self, clock_source):
-        self.clock_source = clock_source
-        self.thermal_contribution = 0.0
-        self.aging_contribution = 0.0
-    def compensate(self, raw_drift, env_data):
-        temp = env_data.get('temp', 25.0)
-        self.thermal_contribution = 0.0005 * (temp - 25)**2  
-        self.aging_contribution = 0.01  
-        return raw_drift - self.thermal_contribution - self.aging_contribution
+    def compensate_many(self, raw_drift, temps, times=None):
+        return np.array(raw_drift, dtype=float)
 class SimulatedDriftModel(BaseDriftModel):
     def __init__(self, clock_source):
         self.clock_source = clock_source
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: ensemble_predictor.py
+
+import math
+from .online_stats import SlidingAutocorrelation, SlidingLinearRegression
+from .clock_kalman import ClockKalmanFilter
+ENSEMBLE_MODELS = ('constant', 'ar1', 'linear', 'kalman')
+class EnsembleDriftPredictor:
+    def __init__(self, mode='blend', error_decay=0.95, process_variance=0.1, measurement_variance=1.0, window_size=50, kalman_states=1, min_error=1e-12):
+        if mode not in ('blend', 'select'):
+            raise ValueError(f"Unsupported ensemble mode: {mode}")
+        if not 0.0 < error_decay < 1.0:
+            raise ValueError("error_decay must be in (0, 1)")
+        self.mode = mode
+        self.error_decay = error_decay
+        self.window_size = window_size
+        self.min_error = min_error
+        self.autocorr = SlidingAutocorrelation(window_size, 1)
+        self.regression = SlidingLinearRegression(window_size)
+        self.kalman = ClockKalmanFilter(kalman_states, process_variance, measurement_variance)
+        self.reset()
+    def reset(self):
+        self.autocorr.reset()
+        self.regression.reset()
+        self.kalman.reset()
+        self.errors = dict.fromkeys(ENSEMBLE_MODELS, math.nan)
+        self.component_predictions = dict.fromkeys(ENSEMBLE_MODELS, 0.0)
+        self.weights = {name: 1.0 / len(ENSEMBLE_MODELS) for name in ENSEMBLE_MODELS}
+        self.last_measurement = None
+        self.last_time = None
+        self.last_prediction = 0.0
+        self.update_count = 0
+        self.dynamic_model = None
+    def _ar1_forecast(self, steps):
+        count = self.autocorr.count
+        if count == 0:
+            return 0.0
+        mean = self.autocorr.s1 / count
+        return mean + self.autocorr.autocorr(1) ** steps * (self.last_measurement - mean)
+    def _component_forecasts(self, steps=1, timestamp=None, kalman=None):
+        last = self.last_measurement
+        if timestamp is None:
+            timestamp = self.update_count - 1 + steps if self.last_time is None else None
+        if self.regression.count > 1 and timestamp is not None:
+            linear = self.regression.predict(timestamp)
+        else:
+            linear = last
+        if kalman is None:
+            kalman = self.kalman.x0 if self.kalman.states == 1 else self.kalman.forecast(steps, include_measurement=False)[0][-1]
+        return {'constant': last, 'ar1': self._ar1_forecast(steps), 'linear': linear, 'kalman': kalman}
+    def _combine(self, forecasts):
+        return sum(self.weights[name] * forecasts[name] for name in ENSEMBLE_MODELS)
+    def _reweight(self):
+        scored = {name: max(error, self.min_error) for name, error in self.errors.items() if not math.isnan(error)}
+        if not scored:
+            return
+        best = min(scored, key=scored.get)
+        self.dynamic_model = best
+        if self.mode == 'select':
+            self.weights = {name: float(name == best) for name in ENSEMBLE_MODELS}
+            return
+        inverse = {name: 1.0 / scored.get(name, scored[best]) for name in ENSEMBLE_MODELS}
+        total = sum(inverse.values())
+        self.weights = {name: value / total for name, value in inverse.items()}
+    def update(self, drift_measurement, timestamp=None):
+        drift_measurement = max(drift_measurement, -70.0)
+        t = self.update_count if timestamp is None else timestamp
+        dt = None if timestamp is None or self.last_time is None else timestamp - self.last_time
+        self.kalman.predict(dt)
+        if self.last_measurement is not None:
+            forecasts = self._component_forecasts(1, t, self.kalman.x0)
+            decay = self.error_decay
+            for name, value in forecasts.items():
+                error = (drift_measurement - value) ** 2
+                previous = self.errors[name]
+                self.errors[name] = error if math.isnan(previous) else decay * previous + (1.0 - decay) * error
+            self.component_predictions = forecasts
+            self.last_prediction = self._combine(forecasts)
+            self._reweight()
+        else:
+            self.last_prediction = drift_measurement
+        self.kalman.correct(drift_measurement)
+        self.autocorr.push(drift_measurement)
+        self.regression.push(t, drift_measurement)
+        self.last_measurement = drift_measurement
+        if timestamp is not None:
+            self.last_time = timestamp
+        self.update_count += 1
+    def predict(self, steps=1, timestamp=None):
+        if self.last_measurement is None:
+            return 0.0
+        return self._combine(self._component_forecasts(steps, timestamp))
+    def get_state(self):
+        return {
+            'mode': self.mode,
+            'errors': {name: float(error) for name, error in self.errors.items()},
+            'weights': {name: float(weight) for name, weight in self.weights.items()},
+            'last_measurement': self.last_measurement,
+            'last_time': self.last_time,
+            'last_prediction': float(self.last_prediction),
+            'update_count': self.update_count,
+            'dynamic_model': self.dynamic_model,
+            'window': [float(v) for v in self.autocorr.values()],
+            'regression': [[float(t), float(d)] for t, d in self.regression.points()],
+            'kalman': self.kalman.get_state()
+        }
+    def set_state(self, state):
+        self.reset()
+        self.kalman.set_state(state['kalman'])
+        self.errors = {name: float(state['errors'][name]) for name in ENSEMBLE_MODELS}
+        self.weights = {name: float(state['weights'][name]) for name in ENSEMBLE_MODELS}
+        self.last_measurement = state['last_measurement']
+        self.last_time = state['last_time']
+        self.last_prediction = float(state['last_prediction'])
+        self.update_count = int(state['update_count'])
+        self.dynamic_model = state['dynamic_model']
+        for value in state['window']:
+            self.autocorr.push(value)
+        for t, d in state['regression']:
+            self.regression.push(t, d)
+    def apply_correction(self, drift_measurement, interval=1.0):
+        self.update(drift_measurement)
+        predicted_drift = self.predict()
+        correction = -predicted_drift * 1e-6 * interval
+        return correction
+    def get_residual(self):
+        if self.last_measurement is not None:
+            return self.last_measurement - self.last_prediction
+        return 0.0
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: fleet_predictor.py
+
+import numpy as np
+_MODEL_NONE, _MODEL_AR1, _MODEL_LINEAR = 0, 1, 2
+_MODEL_NAMES = {_MODEL_NONE: None, _MODEL_AR1: 'ar1', _MODEL_LINEAR: 'linear'}
+class FleetDriftPredictor:
+    def __init__(self, n_nodes, model_type='ar1', process_variance=0.1, measurement_variance=1.0, phi_window=10, window_size=50, autocorr_threshold=0.9, stats_window=1000, autocorr_lag=1, autocorr_hysteresis=0.05):
+        if model_type not in ('ar1', 'kalman'):
+            raise ValueError(f"Unsupported fleet model: {model_type}")
+        self.n_nodes = n_nodes
+        self.model_type = model_type
+        self.q = process_variance
+        self.r = measurement_variance
+        self.phi_window = phi_window
+        self.window_size = window_size
+        self.autocorr_threshold = autocorr_threshold
+        self.autocorr_lag = autocorr_lag
+        self.autocorr_hysteresis = autocorr_hysteresis
+        self.stats_window = stats_window
+        self.last_prediction = np.zeros(n_nodes)
+        self.update_count = np.zeros(n_nodes, dtype=np.int64)
+        self.time_count = np.zeros(n_nodes, dtype=np.int64)
+        self.phi = np.zeros(n_nodes)
+        self.x = np.zeros(n_nodes)
+        self.p = np.ones(n_nodes)
+        self.history = np.zeros((n_nodes, phi_window + 1))
+        self.stats_values = np.zeros((n_nodes, stats_window))
+        self.stats_mean = np.zeros(n_nodes)
+        self.stats_m2 = np.zeros(n_nodes)
+        self.drifts = np.zeros((n_nodes, window_size))
+        self.times = np.zeros((n_nodes, window_size))
+        self.dynamic_model = np.full(n_nodes, _MODEL_NONE, dtype=np.int8)
+    def update(self, measurements, timestamps=None, mask=None):
+        z = np.asarray(measurements, dtype=float)
+        if mask is None:
+            mask = ~np.isnan(z)
+        rows = np.flatnonzero(mask)
+        if len(rows) == 0:
+            return rows
+        t = None if timestamps is None else np.broadcast_to(np.asarray(timestamps, dtype=float), z.shape)[rows]
+        self._update_rows(rows, z[rows], t)
+        return rows
+    def _update_rows(self, rows, z, t=None):
+        z = np.maximum(z, -70.0)
+        count = self.update_count[rows] + 1
+        self.update_count[rows] = count
+        hist_len = self.phi_window + 1
+        newest = (count - 1) % hist_len
+        self.history[rows, newest] = z
+        if self.model_type == 'ar1':
+            self._update_ar1(rows, z, count)
+        else:
+            p_pred = self.p[rows] + self.q
+            gain = p_pred / (p_pred + self.r)
+            x = self.x[rows]
+            x = x + gain * (z - x)
+            self.x[rows] = x
+            self.p[rows] = (1.0 - gain) * p_pred
+            self.last_prediction[rows] = x
+        _, m2 = self._stats_with(rows, z, count)
+        std = np.sqrt(m2 / np.minimum(count, self.stats_window))
+        clip = (count > 1) & (std > 1.0)
+        value = z.copy()
+        if clip.any():
+            mean = self.stats_mean[rows[clip]]
+            offset = z[clip] - mean
+            value[clip] = mean + np.sign(offset) * np.minimum(np.abs(offset), 1.0)
+            self.history[rows[clip], newest[clip]] = value[clip]
+        self._push_stats(rows, value, count)
+        self.drifts[rows, (count - 1) % self.window_size] = z
+        if t is not None:
+            has_time = ~np.isnan(t)
+            timed = rows[has_time]
+            self.time_count[timed] += 1
+            self.times[timed, (self.time_count[timed] - 1) % self.window_size] = t[has_time]
+        self._select_models(rows, count)
+    def _stats_with(self, rows, z, count):
+        size = self.stats_window
+        old = self.stats_values[rows, (count - 1) % size]
+        mean = self.stats_mean[rows]
+        m2 = self.stats_m2[rows]
+        full = count > size
+        n = np.minimum(count, size).astype(float)
+        delta = np.where(full, z - old, z - mean)
+        new_mean = mean + delta / n
+        m2 = m2 + np.where(full, delta * (z - new_mean + old - mean), delta * (z - new_mean))
+        return new_mean, np.maximum(m2, 0.0)
+    def _push_stats(self, rows, z, count):
+        self.stats_mean[rows], self.stats_m2[rows] = self._stats_with(rows, z, count)
+        self.stats_values[rows, (count - 1) % self.stats_window] = z
+    def _update_ar1(self, rows, z, count):
+        hist_len = self.phi_window + 1
+        lags = np.arange(hist_len)
+        ordered = self.history[rows[:, None], (count[:, None] - 1 - lags) % hist_len]
+        pairs = np.minimum(self.phi_window, count - 1)
+        valid = lags[:-1] < pairs[:, None]
+        x_now = np.where(valid, ordered[:, :-1], 0.0)
+        x_prev = np.where(valid, ordered[:, 1:], 0.0)
+        denom = (x_prev * x_prev).sum(axis=1)
+        numer = (x_prev * x_now).sum(axis=1)
+        ok = (denom != 0) & ~np.isnan(denom)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            phi = np.where(ok, np.clip(numer / np.where(ok, denom, 1.0), -0.999, 0.999), 0.0)
+        estimating = count > 2
+        smoothed = 0.5 * phi + 0.5 * self.phi[rows]
+        self.phi[rows] = np.where(estimating, smoothed, self.phi[rows])
+        last = self.last_prediction[rows]
+        last = np.where(estimating, smoothed * z, np.where(count > 1, z, last))
+        self.last_prediction[rows] = last
+    def _ordered_window(self, rows, ring, count):
+        lags = np.arange(self.window_size)
+        filled = np.minimum(count, self.window_size)
+        values = ring[rows[:, None], (count[:, None] - 1 - lags) % self.window_size]
+        return values, lags < filled[:, None]
+    def _select_models(self, rows, count):
+        ready = count >= 10
+        if not ready.any():
+            return
+        rows, count = rows[ready], count[ready]
+        values, valid = self._ordered_window(rows, self.drifts, count)
+        values = np.where(valid, values, 0.0)
+        n = valid.sum(axis=1)
+        lag = self.autocorr_lag
+        dev = np.where(valid, values - values.sum(axis=1, keepdims=True) / n[:, None], 0.0)
+        denom = (dev * dev).sum(axis=1)
+        varying = (denom > 1e-12 * (values * values).sum(axis=1)) & (n > lag)
+        autocorr = np.where(varying, (dev[:, :-lag] * dev[:, lag:]).sum(axis=1) / np.where(varying, denom, 1.0), 0.0)
+        previous = self.dynamic_model[rows]
+        models = np.where(autocorr > self.autocorr_threshold, _MODEL_AR1, previous)
+        demote = (autocorr < self.autocorr_threshold - self.autocorr_hysteresis) | (previous == _MODEL_NONE)
+        self.dynamic_model[rows] = np.where((autocorr <= self.autocorr_threshold) & demote, _MODEL_LINEAR, models)
+    def predict(self, steps=1, timestamps=None):
+        rows = np.arange(self.n_nodes)
+        t = None if timestamps is None else np.broadcast_to(np.asarray(timestamps, dtype=float), (self.n_nodes,))
+        return self._predict_rows(rows, steps, t)
+    def _predict_rows(self, rows, steps=1, t=None):
+        count = self.update_count[rows]
+        filled = np.minimum(count, self.window_size)
+        last = self.drifts[rows, (count - 1) % self.window_size]
+        previous = self.drifts[rows, (count - 2) % self.window_size]
+        nonzero = previous != 0
+        phi = np.where(nonzero, last / np.where(nonzero, previous, 1.0), 1.0)
+        ar1_prediction = last * phi ** (steps - 1)
+        models = self.dynamic_model[rows]
+        predictions = np.where((models == _MODEL_AR1) & (filled > 1), ar1_prediction, last)
+        if t is not None:
+            linear = (models == _MODEL_LINEAR) & (filled > 1) & (self.time_count[rows] == count) & ~np.isnan(t)
+            if linear.any():
+                predictions[linear] = self._linear_predict(rows[linear], count[linear], t[linear])
+        return np.where(count > 0, predictions, 0.0)
+    def _linear_predict(self, rows, count, at):
+        times, valid = self._ordered_window(rows, self.times, count)
+        drifts, _ = self._ordered_window(rows, self.drifts, count)
+        n = valid.sum(axis=1)
+        t_last = times[:, 0]
+        t = np.where(valid, times - t_last[:, None], 0.0)
+        d = np.where(valid, drifts, 0.0)
+        st, sd = t.sum(axis=1), d.sum(axis=1)
+        stt, std = (t * t).sum(axis=1), (t * d).sum(axis=1)
+        den = n * stt - st * st
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = np.where(den != 0, (n * std - st * sd) / den, 0.0)
+        intercept = (sd - slope * st) / n
+        return slope * (at - t_last) + intercept
+    def get_residuals(self):
+        count = self.update_count
+        last = self.drifts[np.arange(self.n_nodes), (count - 1) % self.window_size]
+        return np.where(count > 0, last - self.last_prediction, 0.0)
+    def reset(self, rows=None):
+        rows = np.arange(self.n_nodes) if rows is None else np.atleast_1d(rows)
+        self.last_prediction[rows] = 0.0
+        self.update_count[rows] = 0
+        self.time_count[rows] = 0
+        self.x[rows] = 0.0
+        self.p[rows] = 1.0
+        self.history[rows] = 0.0
+        self.stats_values[rows] = 0.0
+        self.stats_mean[rows] = 0.0
+        self.stats_m2[rows] = 0.0
+        self.drifts[rows] = 0.0
+        self.times[rows] = 0.0
+        self.dynamic_model[rows] = _MODEL_NONE
+    def node(self, index):
+        if not 0 <= index < self.n_nodes:
+            raise IndexError(f"node index {index} out of range")
+        return FleetNodeView(self, index)
+class FleetNodeView:
+    def __init__(self, fleet, index):
+        self.fleet = fleet
+        self.index = index
+        self._rows = np.array([index])
+    @property
+    def model_type(self):
+        return self.fleet.model_type
+    @property
+    def last_prediction(self):
+        return float(self.fleet.last_prediction[self.index])
+    @property
+    def dynamic_model(self):
+        return _MODEL_NAMES[int(self.fleet.dynamic_model[self.index])]
+    @property
+    def drifts(self):
+        count = int(self.fleet.update_count[self.index])
+        values, valid = self.fleet._ordered_window(self._rows, self.fleet.drifts, np.array([count]))
+        return values[0, valid[0]][::-1].tolist()
+    def update(self, drift_measurement, timestamp=None):
+        t = None if timestamp is None else np.array([timestamp], dtype=float)
+        self.fleet._update_rows(self._rows, np.array([drift_measurement], dtype=float), t)
+    def predict(self, steps=1, timestamp=None):
+        t = None if timestamp is None else np.array([timestamp], dtype=float)
+        return float(self.fleet._predict_rows(self._rows, steps, t)[0])
+    def get_residual(self):
+        if self.fleet.update_count[self.index] == 0:
+            return 0.0
+        return self.drifts[-1] - self.last_prediction
+    def apply_correction(self, drift_measurement, interval=1.0):
+        self.update(drift_measurement)
+        return -self.predict() * 1e-6 * interval
+    def reset(self):
+        self.fleet.reset(self.index)
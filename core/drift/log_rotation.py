@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: log_rotation.py
+
+import csv
+import json
+import logging
+import os
+import threading
+import time
+MANIFEST_VERSION = 1
+def write_json_atomic(path, data):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+def load_manifest(path):
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"{path}: unsupported manifest version {manifest.get('version')}")
+    return manifest
+def select_segments(manifest_path, start=None, end=None):
+    manifest = load_manifest(manifest_path)
+    base_dir = os.path.dirname(manifest_path)
+    selected = []
+    for segment in manifest['segments']:
+        if segment['start'] is None:
+            continue
+        if end is not None and segment['start'] > end:
+            continue
+        if start is not None and segment['end'] is not None and segment['end'] < start:
+            continue
+        selected.append(os.path.join(base_dir, segment['file']))
+    return selected
+class RotatingCsvLogSink:
+    def __init__(self, base_path, header=None, max_bytes=None, max_seconds=None, max_segments=None, max_total_bytes=None, compress=True):
+        if max_bytes is None and max_seconds is None:
+            raise ValueError("Rotation needs max_bytes or max_seconds")
+        self.base_path = base_path[:-4] if base_path.endswith('.csv') else base_path
+        self.header = header
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.max_segments = max_segments
+        self.max_total_bytes = max_total_bytes
+        self.compress = compress
+        self.manifest_path = self.base_path + '_manifest.json'
+        self.segments = []
+        self._lock = threading.Lock()
+        self._executor = None
+        self._file = None
+        self._writer = None
+        self._segment = None
+        self._opened_at = 0.0
+        self._sequence = 0
+    def open(self):
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="drift-log-compress")
+        with self._lock:
+            self._write_manifest()
+    def _open_segment(self):
+        self._sequence += 1
+        path = f"{self.base_path}_{self._sequence:04d}.csv"
+        self._file = open(path, 'w', newline='')
+        self._writer = csv.writer(self._file)
+        if self.header is not None:
+            self._writer.writerow(self.header)
+        self._opened_at = time.monotonic()
+        self._segment = {
+            'file': os.path.basename(path),
+            'start': None,
+            'end': None,
+            'samples': 0,
+            'bytes': 0,
+            'compressed': False,
+            'closed': False
+        }
+        with self._lock:
+            self.segments.append(self._segment)
+            self._write_manifest()
+    def write_rows(self, rows):
+        if not rows:
+            return
+        if self._file is None:
+            self._open_segment()
+        self._writer.writerows(rows)
+        segment = self._segment
+        if segment['start'] is None:
+            segment['start'] = rows[0][0]
+        segment['end'] = rows[-1][0]
+        segment['samples'] += len(rows)
+        segment['bytes'] = self._file.tell()
+        if self._should_rotate():
+            self.rotate()
+    def _should_rotate(self):
+        if self.max_bytes is not None and self._segment['bytes'] >= self.max_bytes:
+            return True
+        return self.max_seconds is not None and time.monotonic() - self._opened_at >= self.max_seconds
+    def rotate(self):
+        if self._file is not None:
+            self._close_segment()
+    def _close_segment(self):
+        self._file.close()
+        self._file = None
+        self._writer = None
+        segment = self._segment
+        self._segment = None
+        if segment['samples'] == 0:
+            self._discard_segment(segment)
+            return
+        with self._lock:
+            segment['closed'] = True
+            self._write_manifest()
+        if self.compress:
+            self._executor.submit(self._compress_segment, segment)
+        else:
+            self._executor.submit(self._apply_retention)
+    def _discard_segment(self, segment):
+        try:
+            os.remove(os.path.join(os.path.dirname(self.manifest_path), segment['file']))
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self.segments.remove(segment)
+            self._write_manifest()
+    def _compress_segment(self, segment):
+        directory = os.path.dirname(self.manifest_path)
+        src = os.path.join(directory, segment['file'])
+        dst = src + '.gz'
+        import gzip
+        import shutil
+        try:
+            with open(src, 'rb') as f_in, gzip.open(dst + '.tmp', 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out)
+            os.replace(dst + '.tmp', dst)
+            os.remove(src)
+        except OSError as e:
+            logging.warning(f"Could not compress log segment {src}: {e}")
+            return
+        with self._lock:
+            segment['file'] = os.path.basename(dst)
+            segment['bytes'] = os.path.getsize(dst)
+            segment['compressed'] = True
+            self._write_manifest()
+        self._apply_retention()
+    def _apply_retention(self):
+        directory = os.path.dirname(self.manifest_path)
+        with self._lock:
+            closed = [s for s in self.segments if s['closed']]
+            expired = []
+            if self.max_segments is not None and len(closed) > self.max_segments:
+                expired = closed[:len(closed) - self.max_segments]
+            if self.max_total_bytes is not None:
+                kept = [s for s in closed if s not in expired]
+                total = sum(s['bytes'] for s in kept)
+                while kept and total > self.max_total_bytes:
+                    oldest = kept.pop(0)
+                    total -= oldest['bytes']
+                    expired.append(oldest)
+            if not expired:
+                return
+            for segment in expired:
+                try:
+                    os.remove(os.path.join(directory, segment['file']))
+                except FileNotFoundError:
+                    pass
+                self.segments.remove(segment)
+            self._write_manifest()
+    def _write_manifest(self):
+        write_json_atomic(self.manifest_path, {
+            'version': MANIFEST_VERSION,
+            'header': self.header,
+            'segments': self.segments
+        })
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+    def close(self):
+        if self._file is not None:
+            self._close_segment()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
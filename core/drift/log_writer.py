@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: log_writer.py
+
+import csv
+import logging
+import os
+import queue
+import threading
+import time
+class CsvLogSink:
+    def __init__(self, path, header=None):
+        self.path = path
+        self.header = header
+        self._file = None
+        self._writer = None
+    def open(self):
+        write_header = self.header is not None and (not os.path.exists(self.path) or os.path.getsize(self.path) == 0)
+        self._file = open(self.path, 'a', newline='')
+        self._writer = csv.writer(self._file)
+        if write_header:
+            self._writer.writerow(self.header)
+    def write_rows(self, rows):
+        self._writer.writerows(rows)
+    def flush(self):
+        self._file.flush()
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+class BatchedLogWriter:
+    def __init__(self, sink, max_queue=4096, batch_size=256, flush_interval=1.0, late_threshold=None, poll_interval=0.05):
+        self.sink = sink
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.late_threshold = late_threshold if late_threshold is not None else 2 * flush_interval
+        self.poll_interval = poll_interval
+        self.written = 0
+        self.dropped = 0
+        self.late = 0
+        self._stop = threading.Event()
+        self._thread = None
+    def start(self):
+        if self._thread is not None:
+            return self
+        self.sink.open()
+        self._thread = threading.Thread(target=self._worker, name="drift-log-writer", daemon=True)
+        self._thread.start()
+        return self
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+    def submit(self, row):
+        if self._stop.is_set():
+            self.dropped += 1
+            return False
+        try:
+            self.queue.put_nowait((time.monotonic(), row))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+    def close(self, timeout=5.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logging.warning("Drift log writer did not finish flushing within %.1fs", timeout)
+                return False
+        return True
+    def get_stats(self):
+        return {
+            'written': self.written,
+            'dropped': self.dropped,
+            'late': self.late,
+            'pending': self.queue.qsize()
+        }
+    def _worker(self):
+        batch = []
+        next_flush = time.monotonic() + self.flush_interval
+        try:
+            while not self._stop.is_set():
+                timeout = min(self.poll_interval, max(0.0, next_flush - time.monotonic()))
+                try:
+                    batch.append(self.queue.get(timeout=timeout))
+                    while len(batch) < self.batch_size:
+                        batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    pass
+                now = time.monotonic()
+                if len(batch) >= self.batch_size or (batch and now >= next_flush):
+                    self._write_batch(batch, now)
+                    batch = []
+                if now >= next_flush:
+                    self.sink.flush()
+                    next_flush = now + self.flush_interval
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(batch, time.monotonic())
+            self.sink.flush()
+        except Exception as e:
+            logging.error(f"Drift log writer failed: {e}")
+        finally:
+            self.sink.close()
+    def _write_batch(self, batch, now):
+        self.late += sum(1 for queued_at, _ in batch if now - queued_at > self.late_threshold)
+        self.sink.write_rows([row for _, row in batch])
+        self.written += len(batch)
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: online_stats.py
+
+import math
+from collections import deque
+RESYNC_WINDOWS = 64
+class SlidingWindowStats:
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self._values = deque()
+        self._min = deque()
+        self._max = deque()
+        self._index = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._since_resync = 0
+    def push(self, value):
+        value = float(value)
+        values = self._values
+        if len(values) == self.window:
+            old = values.popleft()
+            values.append(value)
+            old_mean = self._mean
+            delta = value - old
+            self._mean += delta / len(values)
+            self._m2 += delta * (value - self._mean + old - old_mean)
+        else:
+            values.append(value)
+            delta = value - self._mean
+            self._mean += delta / len(values)
+            self._m2 += delta * (value - self._mean)
+        if self._m2 < 0.0:
+            self._m2 = 0.0
+        index = self._index
+        self._index += 1
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((index, value))
+        if self._min[0][0] <= index - self.window:
+            self._min.popleft()
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((index, value))
+        if self._max[0][0] <= index - self.window:
+            self._max.popleft()
+        self._since_resync += 1
+        if self._since_resync >= RESYNC_WINDOWS * self.window:
+            self._resync()
+    def _resync(self):
+        self._since_resync = 0
+        if not self._values:
+            return
+        self._mean = math.fsum(self._values) / len(self._values)
+        self._m2 = math.fsum((v - self._mean) ** 2 for v in self._values)
+    @property
+    def count(self):
+        return len(self._values)
+    @property
+    def mean(self):
+        return self._mean if self._values else 0.0
+    def variance(self, ddof=0):
+        n = len(self._values)
+        if n - ddof <= 0:
+            return 0.0
+        return self._m2 / (n - ddof)
+    def std(self, ddof=0):
+        return math.sqrt(self.variance(ddof))
+    def std_with(self, value, ddof=0):
+        value = float(value)
+        values = self._values
+        n = len(values)
+        if n == self.window:
+            old = values[0]
+            delta = value - old
+            mean = self._mean + delta / n
+            m2 = self._m2 + delta * (value - mean + old - self._mean)
+        else:
+            delta = value - self.mean
+            n += 1
+            mean = self.mean + delta / n
+            m2 = self._m2 + delta * (value - mean)
+        if n - ddof <= 0:
+            return 0.0
+        return math.sqrt(max(m2, 0.0) / (n - ddof))
+    @property
+    def min(self):
+        return self._min[0][1] if self._min else 0.0
+    @property
+    def max(self):
+        return self._max[0][1] if self._max else 0.0
+    @property
+    def last(self):
+        return self._values[-1] if self._values else 0.0
+    def values(self):
+        return list(self._values)
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'std': self.std(),
+            'min': self.min,
+            'max': self.max
+        }
+    def reset(self):
+        self._values.clear()
+        self._min.clear()
+        self._max.clear()
+        self._index = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._since_resync = 0
+class LagOneSums:
+    def __init__(self, window):
+        if window < 0:
+            raise ValueError("window must be non-negative")
+        self.window = window
+        self._pairs = deque()
+        self.sxx = 0.0
+        self.sxy = 0.0
+        self._since_resync = 0
+    def push(self, prev, now):
+        if self.window == 0:
+            return
+        if len(self._pairs) == self.window:
+            old_prev, old_now = self._pairs.popleft()
+            self.sxx -= old_prev * old_prev
+            self.sxy -= old_prev * old_now
+        self._pairs.append((prev, now))
+        self.sxx += prev * prev
+        self.sxy += prev * now
+        self._since_resync += 1
+        if self._since_resync >= RESYNC_WINDOWS * self.window:
+            self._since_resync = 0
+            self.sxx = math.fsum(p * p for p, _ in self._pairs)
+            self.sxy = math.fsum(p * n for p, n in self._pairs)
+    @property
+    def count(self):
+        return len(self._pairs)
+    def pairs(self):
+        return list(self._pairs)
+    def reset(self):
+        self._pairs.clear()
+        self.sxx = 0.0
+        self.sxy = 0.0
+        self._since_resync = 0
+class SlidingLinearRegression:
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self._points = deque()
+        self.origin = 0.0
+        self.st = 0.0
+        self.stt = 0.0
+        self.sd = 0.0
+        self.std = 0.0
+        self.sdd = 0.0
+        self.slope = 0.0
+        self.intercept = 0.0
+        self._since_rebase = 0
+    def push(self, t, d):
+        if not self._points:
+            self.origin = t
+        if len(self._points) == self.window:
+            old_t, old_d = self._points.popleft()
+            tc = old_t - self.origin
+            self.st -= tc
+            self.stt -= tc * tc
+            self.sd -= old_d
+            self.std -= tc * old_d
+            self.sdd -= old_d * old_d
+        self._points.append((t, d))
+        tc = t - self.origin
+        self.st += tc
+        self.stt += tc * tc
+        self.sd += d
+        self.std += tc * d
+        self.sdd += d * d
+        self._since_rebase += 1
+        if self._since_rebase >= self.window:
+            self._rebase()
+        self._solve()
+    def _rebase(self):
+        self._since_rebase = 0
+        points = self._points
+        self.origin = math.fsum(t for t, _ in points) / len(points)
+        centred = [(t - self.origin, d) for t, d in points]
+        self.st = math.fsum(t for t, _ in centred)
+        self.stt = math.fsum(t * t for t, _ in centred)
+        self.sd = math.fsum(d for _, d in centred)
+        self.std = math.fsum(t * d for t, d in centred)
+        self.sdd = math.fsum(d * d for _, d in centred)
+    def _solve(self):
+        n = len(self._points)
+        den = n * self.stt - self.st * self.st
+        self.slope = (n * self.std - self.st * self.sd) / den if den != 0 else 0.0
+        self.intercept = (self.sd - self.slope * self.st) / n
+    @property
+    def count(self):
+        return len(self._points)
+    def points(self):
+        return list(self._points)
+    def predict(self, t):
+        return self.slope * (t - self.origin) + self.intercept
+    def residual_variance(self):
+        n = len(self._points)
+        if n < 3:
+            return math.inf
+        ssr = self.sdd - self.intercept * self.sd - self.slope * self.std
+        return max(ssr, 0.0) / (n - 2)
+    def prediction_variance(self, t):
+        n = len(self._points)
+        sxx = self.stt - self.st * self.st / n if n else 0.0
+        spread = (t - self.origin - self.st / n) ** 2 / sxx if sxx > 0 else 0.0
+        return self.residual_variance() * (1.0 + 1.0 / max(n, 1) + spread)
+    def reset(self):
+        self._points.clear()
+        self.origin = 0.0
+        self.st = self.stt = self.sd = self.std = self.sdd = 0.0
+        self.slope = self.intercept = 0.0
+        self._since_rebase = 0
+class SlidingAutocorrelation:
+    def __init__(self, window, max_lag=1, zero_variance_tolerance=1e-12):
+        if window < 2 or not 1 <= max_lag < window:
+            raise ValueError("need window >= 2 and 1 <= max_lag < window")
+        self.window = window
+        self.max_lag = max_lag
+        self.zero_variance_tolerance = zero_variance_tolerance
+        self._values = deque()
+        self.s1 = 0.0
+        self.s2 = 0.0
+        self.cross = [0.0] * (max_lag + 1)
+        self._since_resync = 0
+    def push(self, value):
+        values = self._values
+        if len(values) == self.window:
+            old = values[0]
+            self.s1 -= old
+            self.s2 -= old * old
+            for k in range(1, self.max_lag + 1):
+                self.cross[k] -= old * values[k]
+            values.popleft()
+        for k in range(1, min(self.max_lag, len(values)) + 1):
+            self.cross[k] += value * values[-k]
+        values.append(value)
+        self.s1 += value
+        self.s2 += value * value
+        self._since_resync += 1
+        if self._since_resync >= RESYNC_WINDOWS * self.window:
+            self._resync()
+    def _resync(self):
+        self._since_resync = 0
+        values = list(self._values)
+        self.s1 = math.fsum(values)
+        self.s2 = math.fsum(v * v for v in values)
+        for k in range(1, self.max_lag + 1):
+            self.cross[k] = math.fsum(a * b for a, b in zip(values, values[k:]))
+    @property
+    def count(self):
+        return len(self._values)
+    def values(self):
+        return list(self._values)
+    def autocorr(self, lag=1):
+        values = self._values
+        n = len(values)
+        if not 1 <= lag <= self.max_lag or n <= lag:
+            return 0.0
+        mean = self.s1 / n
+        denom = self.s2 - n * mean * mean
+        if denom <= self.zero_variance_tolerance * self.s2:
+            return 0.0
+        head = math.fsum(values[i] for i in range(lag))
+        tail = math.fsum(values[-i] for i in range(1, lag + 1))
+        numer = self.cross[lag] - mean * ((self.s1 - tail) + (self.s1 - head)) + (n - lag) * mean * mean
+        return numer / denom
+    def innovation_variance(self, phi, mean=0.0):
+        values = self._values
+        n = len(values)
+        if n < 2:
+            return math.inf
+        first, last = values[0], values[-1]
+        head = self.s1 - last
+        tail = self.s1 - first
+        pairs = n - 1
+        saa = (self.s2 - first * first) - 2.0 * mean * tail + pairs * mean * mean
+        sbb = (self.s2 - last * last) - 2.0 * mean * head + pairs * mean * mean
+        sab = self.cross[1] - mean * (head + tail) + pairs * mean * mean
+        sse = saa - 2.0 * phi * sab + phi * phi * sbb
+        return max(sse, 0.0) / pairs
+    def reset(self):
+        self._values.clear()
+        self.s1 = 0.0
+        self.s2 = 0.0
+        self.cross = [0.0] * (self.max_lag + 1)
+        self._since_resync = 0
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: predictor_checkpoint.py
+
+import os
+import json
+import time
+import queue
+import logging
+import threading
+from .log_rotation import write_json_atomic
+CHECKPOINT_VERSION = 1
+DEFAULT_MAX_AGE = 3600.0
+DEFAULT_MAX_TEMPERATURE_DELTA = 5.0
+def checkpoint_payload(target, temperature=None, now=None):
+    return {
+        'version': CHECKPOINT_VERSION,
+        'kind': type(target).__name__,
+        'saved_at': time.time() if now is None else now,
+        'temperature': temperature,
+        'state': target.get_state()
+    }
+def write_checkpoint(path, payload):
+    checkpoint_dir = os.path.dirname(path)
+    if checkpoint_dir:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+    write_json_atomic(path, payload)
+    return payload
+def save_checkpoint(path, target, temperature=None, now=None):
+    return write_checkpoint(path, checkpoint_payload(target, temperature, now))
+def check_checkpoint(payload, kind=None, max_age=DEFAULT_MAX_AGE, temperature=None, max_temperature_delta=DEFAULT_MAX_TEMPERATURE_DELTA, now=None):
+    if payload.get('version') != CHECKPOINT_VERSION:
+        return f"unsupported version {payload.get('version')}"
+    if kind is not None and payload.get('kind') != kind:
+        return f"checkpoint is for {payload.get('kind')}, not {kind}"
+    age = (time.time() if now is None else now) - payload.get('saved_at', 0.0)
+    if max_age is not None and not 0.0 <= age <= max_age:
+        return f"checkpoint age {age:.0f}s outside [0, {max_age:.0f}]s"
+    saved_temperature = payload.get('temperature')
+    if max_temperature_delta is not None and temperature is not None and saved_temperature is not None:
+        delta = abs(temperature - saved_temperature)
+        if delta > max_temperature_delta:
+            return f"temperature moved {delta:.1f}°C since checkpoint"
+    return None
+def load_checkpoint(path, kind=None, max_age=DEFAULT_MAX_AGE, temperature=None, max_temperature_delta=DEFAULT_MAX_TEMPERATURE_DELTA, now=None):
+    try:
+        with open(path) as f:
+            payload = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+        return None
+    reason = check_checkpoint(payload, kind, max_age, temperature, max_temperature_delta, now)
+    if reason is not None:
+        logging.info(f"Ignoring checkpoint {path}: {reason}")
+        return None
+    return payload['state']
+def restore_checkpoint(path, target, **validity):
+    state = load_checkpoint(path, kind=type(target).__name__, **validity)
+    if state is None:
+        return False
+    try:
+        target.set_state(state)
+    except (KeyError, TypeError, ValueError) as e:
+        logging.warning(f"Checkpoint {path} does not match {type(target).__name__}: {e}")
+        target.reset()
+        return False
+    logging.info(f"Restored {type(target).__name__} from {path}")
+    return True
+class PeriodicCheckpointer:
+    def __init__(self, path, target, interval=60.0, temperature_fn=None, clock=time.monotonic, background=False, poll_interval=0.5):
+        self.path = path
+        self.target = target
+        self.interval = interval
+        self.temperature_fn = temperature_fn
+        self.clock = clock
+        self.last_save = clock()
+        self.saves = 0
+        self.failures = 0
+        self.superseded = 0
+        self.background = background
+        self.poll_interval = poll_interval
+        self.queue = queue.Queue(maxsize=1)
+        self._stop = threading.Event()
+        self._thread = None
+    def _snapshot(self):
+        temperature = self.temperature_fn() if self.temperature_fn is not None else None
+        return checkpoint_payload(self.target, temperature)
+    def _write(self, payload):
+        try:
+            write_checkpoint(self.path, payload)
+        except Exception as e:
+            self.failures += 1
+            logging.warning(f"Checkpoint write to {self.path} failed: {e}")
+            return False
+        self.saves += 1
+        return True
+    def save(self):
+        self.last_save = self.clock()
+        try:
+            payload = self._snapshot()
+        except Exception as e:
+            self.failures += 1
+            logging.warning(f"Checkpoint snapshot for {self.path} failed: {e}")
+            return False
+        return self._write(payload)
+    def maybe_save(self):
+        if self.clock() - self.last_save < self.interval:
+            return False
+        if not self.background:
+            return self.save()
+        self.last_save = self.clock()
+        try:
+            payload = self._snapshot()
+        except Exception as e:
+            self.failures += 1
+            logging.warning(f"Checkpoint snapshot for {self.path} failed: {e}")
+            return False
+        self.start()
+        try:
+            self.queue.get_nowait()
+            self.superseded += 1
+        except queue.Empty:
+            pass
+        self.queue.put_nowait(payload)
+        return True
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="drift-checkpoint-writer", daemon=True)
+            self._thread.start()
+        return self
+    def close(self, timeout=5.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logging.warning("Checkpoint writer did not finish within %.1fs", timeout)
+                return False
+        return True
+    def _worker(self):
+        while True:
+            try:
+                payload = self.queue.get(timeout=self.poll_interval)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+            self._write(payload)
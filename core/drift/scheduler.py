@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: scheduler.py
+
+import time
+from bisect import bisect_right
+MIN_INTERVAL = 0.001
+HYBRID_SPIN_THRESHOLD = 0.0003
+LATENESS_BUCKETS_US = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000)
+class DeadlineScheduler:
+    def __init__(self, interval, spin_threshold=0.0, clock=time.perf_counter):
+        if interval < MIN_INTERVAL:
+            raise ValueError(f"Sample interval must be at least {MIN_INTERVAL * 1e3:.0f} ms")
+        if spin_threshold < 0 or spin_threshold >= interval:
+            raise ValueError("spin_threshold must be non-negative and shorter than the interval")
+        self.interval = interval
+        self.spin_threshold = spin_threshold
+        self.clock = clock
+        self.lateness_histogram = [0] * (len(LATENESS_BUCKETS_US) + 1)
+        self.ticks = 0
+        self.missed = 0
+        self.max_lateness = 0.0
+        self.total_lateness = 0.0
+        self._start = None
+        self._tick_index = 0
+    def start(self):
+        self._start = self.clock()
+        self._tick_index = 0
+        return self
+    @property
+    def next_deadline(self):
+        return self._start + self._tick_index * self.interval
+    def wait(self):
+        if self._start is None:
+            self.start()
+        deadline = self.next_deadline
+        remaining = deadline - self.clock()
+        if remaining > self.spin_threshold:
+            time.sleep(remaining - self.spin_threshold)
+        if self.spin_threshold > 0:
+            while self.clock() < deadline:
+                pass
+        return self._complete(deadline)
+    async def wait_async(self):
+        import asyncio
+        if self._start is None:
+            self.start()
+        deadline = self.next_deadline
+        remaining = deadline - self.clock()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        return self._complete(deadline)
+    def _complete(self, deadline):
+        lateness = max(0.0, self.clock() - deadline)
+        self._record(lateness)
+        skipped = int(lateness // self.interval)
+        self.missed += skipped
+        self._tick_index += skipped + 1
+        return lateness
+    def _record(self, lateness):
+        self.ticks += 1
+        self.total_lateness += lateness
+        if lateness > self.max_lateness:
+            self.max_lateness = lateness
+        self.lateness_histogram[bisect_right(LATENESS_BUCKETS_US, lateness * 1e6)] += 1
+    def get_stats(self):
+        return {
+            'ticks': self.ticks,
+            'missed': self.missed,
+            'mean_lateness_us': 1e6 * self.total_lateness / self.ticks if self.ticks else 0.0,
+            'max_lateness_us': 1e6 * self.max_lateness,
+            'histogram_us': dict(zip([f"<{b}" for b in LATENESS_BUCKETS_US] + [f">={LATENESS_BUCKETS_US[-1]}"], self.lateness_histogram))
+        }
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: spectral_decomposition.py
+
+import math
+import logging
+import numpy as np
+from .binary_log import read_binary_log, read_header
+DEFAULT_BANDS = (
+    ('noise', 0.0, 10.0),
+    ('thermal', 10.0, 21600.0),
+    ('aging', 21600.0, math.inf)
+)
+DEFAULT_CHUNK_SIZE = 1 << 20
+def _iter_binary_column(path, column, chunk_size):
+    records = read_binary_log(path, ordered=False)
+    written = read_header(path)['written']
+    head = written % len(records) if written > len(records) else 0
+    for part in (records[head:], records[:head]):
+        for start in range(0, len(part), chunk_size):
+            yield np.array(part[column][start:start + chunk_size])
+def iter_log_drift(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    if path.endswith('.bin'):
+        yield from _iter_binary_column(path, 'drift_ppm', chunk_size)
+        return
+    import pandas as pd
+    if path.endswith('_manifest.json'):
+        from .log_rotation import select_segments
+        paths = select_segments(path)
+    else:
+        paths = [path]
+    for segment in paths:
+        for frame in pd.read_csv(segment, usecols=['drift_ppm'], chunksize=chunk_size):
+            yield frame['drift_ppm'].to_numpy(dtype=float)
+def log_sample_interval(path, probe=4096):
+    if path.endswith('.bin'):
+        monotonic = next(_iter_binary_column(path, 'monotonic', probe), np.array([]))
+    else:
+        import pandas as pd
+        if path.endswith('_manifest.json'):
+            from .log_rotation import select_segments
+            paths = select_segments(path)[:1]
+        else:
+            paths = [path]
+        monotonic = np.concatenate([pd.read_csv(p, usecols=['monotonic'], nrows=probe)['monotonic'].to_numpy(dtype=float) for p in paths]) if paths else np.array([])
+    steps = np.diff(monotonic)
+    steps = steps[steps > 0]
+    if len(steps) == 0:
+        from .drift_collector import SAMPLE_INTERVAL
+        logging.warning(f"Cannot infer sample interval from {path}, assuming {SAMPLE_INTERVAL}s")
+        return SAMPLE_INTERVAL
+    return float(np.median(steps))
+class WaveletBandDecomposer:
+    def __init__(self, tau0=1.0, bands=DEFAULT_BANDS, wavelet='db4', level=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        import pywt
+        self.tau0 = tau0
+        self.bands = tuple(bands)
+        self.wavelet = pywt.Wavelet(wavelet)
+        filter_len = self.wavelet.dec_len
+        max_level = max(1, int(math.log2(chunk_size / (2 * filter_len))))
+        if level is None:
+            coarsest = max(low for _, low, _ in self.bands)
+            level = max(1, math.ceil(math.log2(max(coarsest / tau0, 2.0))))
+            if level > max_level:
+                logging.warning(f"Chunk size {chunk_size} limits the DWT to {max_level} levels; "
+                                f"'{self.bands[-1][0]}' band also holds periods above {2 ** max_level * tau0:.4g}s")
+                level = max_level
+        self.level = level
+        block = 1 << level
+        self.margin = filter_len * block
+        self.chunk_size = max(block, chunk_size // block * block)
+        self.level_bands = [self._band_for_period(2 ** (j + 0.5) * tau0) for j in range(level, 0, -1)]
+        self.approximation_band = self.bands[-1][0]
+        self.reset()
+    def _band_for_period(self, period):
+        for name, low, high in self.bands:
+            if low <= period < high:
+                return name
+        return self.bands[-1][0]
+    def reset(self):
+        self.band_energy = dict.fromkeys((name for name, _, _ in self.bands), 0.0)
+        self.samples = 0
+    def _split(self, window):
+        import pywt
+        import warnings
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            coeffs = pywt.wavedec(window, self.wavelet, mode='symmetric', level=self.level)
+        components = {}
+        for name, _, _ in self.bands:
+            selected = [c if (self.approximation_band if i == 0 else self.level_bands[i - 1]) == name else np.zeros_like(c)
+                        for i, c in enumerate(coeffs)]
+            components[name] = pywt.waverec(selected, self.wavelet, mode='symmetric')[:len(window)]
+        return components
+    def _emit(self, buffer, buffer_start, start, stop):
+        window_start = max(buffer_start, start - self.margin)
+        window_stop = min(buffer_start + len(buffer), stop + self.margin)
+        components = self._split(buffer[window_start - buffer_start:window_stop - buffer_start])
+        lo, hi = start - window_start, stop - window_start
+        components = {name: values[lo:hi] for name, values in components.items()}
+        for name, values in components.items():
+            self.band_energy[name] += float(np.dot(values, values))
+        self.samples += stop - start
+        return start, components
+    def process(self, chunks):
+        buffer = np.empty(0)
+        buffer_start = 0
+        position = 0
+        for chunk in chunks:
+            buffer = np.concatenate((buffer, np.asarray(chunk, dtype=float)))
+            while buffer_start + len(buffer) >= position + self.chunk_size + self.margin:
+                yield self._emit(buffer, buffer_start, position, position + self.chunk_size)
+                position += self.chunk_size
+                keep = max(position - self.margin - buffer_start, 0)
+                buffer = buffer[keep:]
+                buffer_start += keep
+        end = buffer_start + len(buffer)
+        while position < end:
+            stop = min(position + self.chunk_size, end)
+            yield self._emit(buffer, buffer_start, position, stop)
+            position = stop
+    def decompose(self, series):
+        parts = {name: [] for name, _, _ in self.bands}
+        for _, components in self.process([series]):
+            for name, values in components.items():
+                parts[name].append(values)
+        return {name: np.concatenate(values) if values else np.empty(0) for name, values in parts.items()}
+    def band_power(self):
+        return {name: energy / self.samples if self.samples else 0.0 for name, energy in self.band_energy.items()}
+class StreamingWelchPSD:
+    def __init__(self, nperseg=4096, fs=1.0, overlap=0.5):
+        if not 0.0 <= overlap < 1.0:
+            raise ValueError("overlap must be in [0, 1)")
+        self.nperseg = nperseg
+        self.fs = fs
+        self.step = max(1, int(round(nperseg * (1.0 - overlap))))
+        self.window = np.hanning(nperseg + 1)[:-1]
+        self.scale = 1.0 / (fs * np.dot(self.window, self.window))
+        self.reset()
+    def reset(self):
+        self._pending = np.empty(0)
+        self._power = np.zeros(self.nperseg // 2 + 1)
+        self.segments = 0
+    def push(self, values):
+        data = np.concatenate((self._pending, np.asarray(values, dtype=float)))
+        count = (len(data) - self.nperseg) // self.step + 1 if len(data) >= self.nperseg else 0
+        if count:
+            frames = np.lib.stride_tricks.sliding_window_view(data, self.nperseg)[::self.step][:count]
+            frames = frames - frames.mean(axis=1, keepdims=True)
+            spectrum = np.fft.rfft(frames * self.window, axis=1)
+            self._power += (spectrum.real ** 2 + spectrum.imag ** 2).sum(axis=0)
+            self.segments += count
+        self._pending = data[count * self.step:]
+    def psd(self):
+        freqs = np.fft.rfftfreq(self.nperseg, 1.0 / self.fs)
+        if not self.segments:
+            return freqs, np.full(len(freqs), np.nan)
+        pxx = self._power * self.scale / self.segments
+        pxx[1:-1 if self.nperseg % 2 == 0 else None] *= 2.0
+        return freqs, pxx
+def analyze_drift_log(path, tau0, bands=DEFAULT_BANDS, wavelet='db4', chunk_size=DEFAULT_CHUNK_SIZE, nperseg=4096):
+    decomposer = WaveletBandDecomposer(tau0, bands, wavelet, chunk_size=chunk_size)
+    welch = StreamingWelchPSD(nperseg, fs=1.0 / tau0)
+    def chunks():
+        for chunk in iter_log_drift(path, chunk_size):
+            welch.push(chunk)
+            yield chunk
+    for _ in decomposer.process(chunks()):
+        pass
+    freqs, pxx = welch.psd()
+    return {
+        'samples': decomposer.samples,
+        'band_power': decomposer.band_power(),
+        'frequency': freqs,
+        'psd': pxx
+    }
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Band-split a drift log with a chunked DWT and Welch PSD")
+    parser.add_argument("log", help="Drift log (.csv, .bin or rotation manifest)")
+    parser.add_argument("--tau0", type=float, default=None, help="Sample interval in seconds (default: inferred from the log's monotonic column)")
+    args = parser.parse_args()
+    tau0 = args.tau0 if args.tau0 is not None else log_sample_interval(args.log)
+    result = analyze_drift_log(args.log, tau0)
+    print(f"Samples: {result['samples']} (tau0={tau0:.6g}s)")
+    for name, power in result['band_power'].items():
+        print(f"{name:>10}: mean square {power:.4g} ppm^2")
+    peak = int(np.nanargmax(result['psd'][1:])) + 1 if len(result['psd']) > 1 else 0
+    print(f"PSD peak at {result['frequency'][peak]:.4g} Hz")
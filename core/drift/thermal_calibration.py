@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: thermal_calibration.py
+
+import os
+import time
+import numpy as np
+CALIBRATION_VERSION = 1
+CALIBRATION_DIR = "calibration"
+REFERENCE_TEMP = 25.0
+TABLE_RANGE = (-40.0, 125.0)
+TABLE_RESOLUTION = 0.05
+def fit_thermal_coefficients(temps, drifts, degree=2, t0=REFERENCE_TEMP):
+    dt = np.asarray(temps, dtype=float) - t0
+    y = np.asarray(drifts, dtype=float)
+    if len(dt) <= degree:
+        raise ValueError(f"Need more than {degree} samples for a degree {degree} fit")
+    scale = max(float(np.abs(dt).max()), 1.0)
+    design = np.vander(dt / scale, degree + 1, increasing=True)
+    solution, _, _, _ = np.linalg.lstsq(design, y.T, rcond=None)
+    residual = y.T - design @ solution
+    return solution.T / scale ** np.arange(degree + 1), np.sqrt(np.mean(residual ** 2, axis=0))
+def calibration_path(clock_source, directory=CALIBRATION_DIR):
+    return os.path.join(directory, f"thermal_{clock_source}.json")
+class ThermalCalibration:
+    def __init__(self, coefficients, t0=REFERENCE_TEMP, clock_source=None, t_range=TABLE_RANGE, resolution=TABLE_RESOLUTION, rms_residual=None, samples=0, time_constant=None, hysteresis=0.0):
+        self.coefficients = np.asarray(coefficients, dtype=float)
+        self.t0 = t0
+        self.clock_source = clock_source
+        self.t_min, self.t_max = t_range
+        self.resolution = resolution
+        self.rms_residual = rms_residual
+        self.samples = samples
+        self.time_constant = time_constant
+        self.hysteresis = hysteresis
+        self.grid = np.arange(self.t_min, self.t_max + 0.5 * resolution, resolution)
+        self.table = np.polynomial.polynomial.polyval(self.grid - t0, self.coefficients)
+        self._table = self.table.tolist()
+        self._inv_resolution = 1.0 / resolution
+        self._last_index = len(self._table) - 1
+    @classmethod
+    def fit(cls, temps, drifts, degree=2, t0=REFERENCE_TEMP, clock_source=None, **options):
+        coefficients, rms = fit_thermal_coefficients(temps, drifts, degree, t0)
+        return cls(coefficients, t0, clock_source, rms_residual=float(rms), samples=len(temps), **options)
+    def evaluate(self, temp):
+        position = (temp - self.t_min) * self._inv_resolution
+        if position <= 0.0:
+            return self._table[0]
+        if position >= self._last_index:
+            return self._table[-1]
+        i = int(position)
+        low = self._table[i]
+        return low + (position - i) * (self._table[i + 1] - low)
+    def evaluate_many(self, temps):
+        return np.interp(temps, self.grid, self.table)
+    def to_dict(self):
+        return {
+            'version': CALIBRATION_VERSION,
+            'clock_source': self.clock_source,
+            'coefficients': self.coefficients.tolist(),
+            't0': self.t0,
+            't_range': [self.t_min, self.t_max],
+            'resolution': self.resolution,
+            'rms_residual': self.rms_residual,
+            'samples': self.samples,
+            'time_constant': self.time_constant,
+            'hysteresis': self.hysteresis,
+            'fitted_at': time.time()
+        }
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('version') != CALIBRATION_VERSION:
+            raise ValueError(f"Unsupported thermal calibration version {data.get('version')}")
+        return cls(data['coefficients'], data['t0'], data['clock_source'], tuple(data['t_range']),
+                   data['resolution'], data.get('rms_residual'), data.get('samples', 0),
+                   data.get('time_constant'), data.get('hysteresis', 0.0))
+    def save(self, path=None, directory=CALIBRATION_DIR):
+        from .log_rotation import write_json_atomic
+        path = path or calibration_path(self.clock_source, directory)
+        calibration_dir = os.path.dirname(path)
+        if calibration_dir:
+            os.makedirs(calibration_dir, exist_ok=True)
+        write_json_atomic(path, self.to_dict())
+        return path
+def load_calibration(clock_source, directory=CALIBRATION_DIR):
+    path = calibration_path(clock_source, directory)
+    if not os.path.exists(path):
+        return None
+    import json
+    with open(path) as f:
+        return ThermalCalibration.from_dict(json.load(f))
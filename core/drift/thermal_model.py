@@ -30,26 +30,170 @@
 
 # File: thermal_model.py
 
+import math
+import time
+import numpy as np
 from collections import deque
+DEFAULT_TIME_CONSTANTS = tuple(np.geomspace(5.0, 1800.0, 40))
+DEFAULT_HYSTERESIS_WIDTHS = tuple(np.linspace(0.0, 4.0, 17))
+REFERENCE_TEMP = 25.0
+def _affine_scan(a, b):
+    a = a.copy()
+    b = b.copy()
+    step = 1
+    while step < a.shape[-1]:
+        b[..., step:] = a[..., step:] * b[..., :-step] + b[..., step:]
+        a[..., step:] = a[..., step:] * a[..., :-step]
+        step *= 2
+    return a, b
+def _clip_scan(low, high):
+    low = low.copy()
+    high = high.copy()
+    step = 1
+    while step < low.shape[-1]:
+        lo, hi = low[..., step:], high[..., step:]
+        new_low = np.minimum(np.maximum(low[..., :-step], lo), hi)
+        new_high = np.minimum(np.maximum(high[..., :-step], lo), hi)
+        low[..., step:] = new_low
+        high[..., step:] = new_high
+        step *= 2
+    return low, high
+class ThermalDynamics:
+    def __init__(self, time_constant, hysteresis=0.0, clock=time.monotonic):
+        if time_constant <= 0:
+            raise ValueError("time_constant must be positive")
+        self.time_constant = time_constant
+        self.hysteresis = hysteresis
+        self.clock = clock
+        self.reset()
+    def reset(self, temp=None):
+        self.lagged = temp
+        self.effective = temp
+        self.last_time = None
+    def update(self, temp, now=None):
+        now = self.clock() if now is None else now
+        if self.lagged is None:
+            self.lagged = self.effective = temp
+        else:
+            dt = max(now - self.last_time, 0.0)
+            self.lagged += (1.0 - math.exp(-dt / self.time_constant)) * (temp - self.lagged)
+            half = 0.5 * self.hysteresis
+            self.effective = min(max(self.effective, self.lagged - half), self.lagged + half)
+        self.last_time = now
+        return self.effective
+    def filter_many(self, temps, times):
+        temps = np.asarray(temps, dtype=float)
+        times = np.broadcast_to(np.asarray(times, dtype=float), temps.shape)
+        if temps.shape[-1] == 0:
+            return temps.copy()
+        decay = np.empty(temps.shape)
+        decay[..., 1:] = np.exp(-np.maximum(np.diff(times, axis=-1), 0.0) / self.time_constant)
+        if self.lagged is None:
+            decay[..., 0] = 0.0
+            lagged_start, effective_start = 0.0, temps[..., :1]
+        else:
+            decay[..., 0] = math.exp(-max(times.flat[0] - self.last_time, 0.0) / self.time_constant)
+            lagged_start, effective_start = self.lagged, self.effective
+        scale, offset = _affine_scan(decay, (1.0 - decay) * temps)
+        lagged = scale * lagged_start + offset
+        half = 0.5 * self.hysteresis
+        low, high = _clip_scan(lagged - half, lagged + half)
+        return np.minimum(np.maximum(effective_start, low), high)
+def iter_thermal_dynamics(times, temps, time_constants, widths):
+    times = np.asarray(times, dtype=float)
+    temps = np.asarray(temps, dtype=float)
+    tau = np.asarray(time_constants, dtype=float)
+    half = 0.5 * np.asarray(widths, dtype=float)[None, :]
+    lagged = np.full((len(tau), 1), temps[0])
+    effective = np.full((len(tau), half.shape[1]), temps[0])
+    yield effective
+    for i in range(1, len(temps)):
+        decay = np.exp(-(times[i] - times[i - 1]) / tau)[:, None]
+        lagged = temps[i] + decay * (lagged - temps[i])
+        effective = np.minimum(np.maximum(effective, lagged - half), lagged + half)
+        yield effective
+def fit_thermal_dynamics(times, temps, drifts, static_drift, time_constants=DEFAULT_TIME_CONSTANTS, widths=DEFAULT_HYSTERESIS_WIDTHS):
+    drifts = np.asarray(drifts, dtype=float)
+    offset = drifts.mean()
+    total = 0.0
+    total_sq = 0.0
+    for drift, effective in zip(drifts, iter_thermal_dynamics(times, temps, time_constants, widths)):
+        residual = (drift - offset) - static_drift(effective)
+        total = total + residual
+        total_sq = total_sq + residual * residual
+    n = len(drifts)
+    rms = np.sqrt(np.maximum(total_sq / n - (total / n) ** 2, 0.0))
+    i, j = np.unravel_index(np.argmin(rms), rms.shape)
+    return float(time_constants[i]), float(widths[j]), float(rms[i, j])
+def fit_thermal_calibration(times, temps, drifts, degree=2, clock_source=None, iterations=3,
+                            time_constants=DEFAULT_TIME_CONSTANTS, widths=DEFAULT_HYSTERESIS_WIDTHS):
+    from .thermal_calibration import ThermalCalibration
+    times = np.asarray(times, dtype=float)
+    temps = np.asarray(temps, dtype=float)
+    effective = temps
+    calibration = ThermalCalibration.fit(effective, drifts, degree, clock_source=clock_source)
+    for _ in range(iterations):
+        time_constant, hysteresis, _ = fit_thermal_dynamics(times, temps, drifts, calibration.evaluate_many, time_constants, widths)
+        dynamics = ThermalDynamics(time_constant, hysteresis)
+        effective = np.array([dynamics.update(temp, now) for temp, now in zip(temps.tolist(), times.tolist())])
+        calibration = ThermalCalibration.fit(effective, drifts, degree, clock_source=clock_source,
+                                             time_constant=time_constant, hysteresis=hysteresis)
+    return calibration
 class ThermalDriftModel:
-    def __init__(self, clock_type, mode="WSL"):
+    def __init__(self, clock_type, mode="WSL", calibration=None, time_constant=None, hysteresis=None, polynomial=None, aging=0.0):
         self.clock_type = clock_type
         self.mode = mode
+        self.calibration = calibration
         self.thermal_coeffs = self._get_coefficients()
+        self.polynomial = tuple(polynomial) if polynomial is not None else self._default_polynomial()
+        self.aging = aging if calibration is None else 0.0
         self.thermal_history = deque(maxlen=100)
         self.thermal_drift = 0.0  
+        self.aging_contribution = 0.0
+        if time_constant is None and self.calibration is not None:
+            time_constant = self.calibration.time_constant
+            hysteresis = self.calibration.hysteresis if hysteresis is None else hysteresis
+        self.dynamics = ThermalDynamics(time_constant, hysteresis or 0.0) if time_constant else None
+    @classmethod
+    def load(cls, clock_type, mode="WSL", directory=None, **options):
+        from .thermal_calibration import load_calibration, CALIBRATION_DIR
+        calibration = load_calibration(clock_type, CALIBRATION_DIR if directory is None else directory)
+        return cls(clock_type, mode, calibration=calibration, **options)
     def compensate(self, raw_drift, env_data):
-        temp = env_data.get('temp', 25.0)  
+        temp = env_data.get('temp', REFERENCE_TEMP)  
         self.thermal_history.append(temp)
-        if self.mode == "WSL":
-            self.thermal_drift = self._simulate_thermal_drift(temp)
-        else:
-            if self.clock_type == "External":
-                T0 = 25  
-                self.thermal_drift = self.thermal_coeffs['a'] * (temp - T0)**2
-            else:
-                self.thermal_drift = self.thermal_coeffs['k'] * temp
-        return raw_drift - self.thermal_drift
+        if self.dynamics is not None:
+            temp = self.dynamics.update(temp, env_data.get('time'))
+        self.thermal_drift = self._static_drift(temp)
+        self.aging_contribution = self.aging
+        return raw_drift - self.thermal_drift - self.aging
+    def compensate_many(self, raw_drift, temps, times=None):
+        temps = np.asarray(temps, dtype=float)
+        if self.dynamics is not None:
+            if times is None:
+                raise ValueError("times are required when thermal dynamics are enabled")
+            temps = self.dynamics.filter_many(temps, times)
+        return np.asarray(raw_drift, dtype=float) - self._static_drift_many(temps) - self.aging
+    def _static_drift(self, temp):
+        if self.calibration is not None:
+            return self.calibration.evaluate(temp)
+        dt = temp - REFERENCE_TEMP
+        drift = 0.0
+        for c in reversed(self.polynomial):
+            drift = drift * dt + c
+        return drift
+    def _static_drift_many(self, temps):
+        temps = np.asarray(temps, dtype=float)
+        if self.calibration is not None:
+            return self.calibration.evaluate_many(temps)
+        return np.polynomial.polynomial.polyval(temps - REFERENCE_TEMP, self.polynomial)
+    def fit_dynamics(self, times, temps, drifts, time_constants=DEFAULT_TIME_CONSTANTS, widths=DEFAULT_HYSTERESIS_WIDTHS):
+        time_constant, hysteresis, rms = fit_thermal_dynamics(times, temps, drifts, self._static_drift_many, time_constants, widths)
+        self.dynamics = ThermalDynamics(time_constant, hysteresis)
+        if self.calibration is not None:
+            self.calibration.time_constant = time_constant
+            self.calibration.hysteresis = hysteresis
+        return time_constant, hysteresis, rms
     def _get_coefficients(self):
         if self.mode == "WSL":
             return {
@@ -60,12 +204,14 @@ class ThermalDriftModel:
             'a': -0.035,  
             'k': -0.15    
         }
-    def _simulate_thermal_drift(self, temp):
+    def _default_polynomial(self):
         if self.clock_type == "External":
-            T0 = 25  
-            return -0.03 * (temp - T0)**2  
-        else:
-            return -0.1 * temp  
+            return (0.0, 0.0, self.thermal_coeffs['a'])
+        k = self.thermal_coeffs['k']
+        return (k * REFERENCE_TEMP, k)
+    @property
+    def clock_source(self):
+        return self.clock_type
     @property
     def thermal_contribution(self):
         return self.thermal_drift
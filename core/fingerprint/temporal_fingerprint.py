@@ -32,9 +32,9 @@
 
 import hashlib
 import numpy as np
-from scipy import stats
 import struct
 def generate_fingerprint(drift_data, window_size=30):
+    from scipy import stats
     if isinstance(drift_data, list):
         drift_data = np.array(drift_data)
     samples = int(window_size * 10)
@@ -31,6 +31,29 @@
 # File: clock_drift_model.py
 
 import numpy as np
+import math
+from core.simulation.oscillator_noise import resolve_noise_model
+PROFILE_CHUNK_SIZE = 1 << 16
+def _profile_chunk(rng, t, profile_type, sine_amplitude, sine_freq, noise_std, drift_slope):
+    noise = rng.normal(0, noise_std, len(t))
+    if profile_type in ("burst", "ramp"):
+        return noise + drift_slope * t
+    return sine_amplitude * np.sin(sine_freq * t) + noise + drift_slope * t
+def _apply_events(drift, start, length, profile_type, thermal_spikes, power_events, burst_params):
+    stop = start + len(drift)
+    spans = []
+    if profile_type == "burst" and burst_params:
+        spans.append((burst_params.get("start", 0), burst_params.get("duration", 10), burst_params.get("magnitude", 20)))
+    spans.extend(thermal_spikes or ())
+    for span_start, duration, magnitude in spans:
+        lo = max(span_start, start)
+        hi = min(span_start + duration, length, stop)
+        if lo < hi:
+            drift[lo - start:hi - start] += magnitude
+    for idx, offset in power_events or ():
+        if 0 <= idx < min(length, stop):
+            drift[max(idx - start, 0):] += offset
+    return np.maximum(drift, -70.0)
 def generate_drift_profile(
     length,
     sampling_rate=1,
@@ -41,46 +64,106 @@ def generate_drift_profile(
     drift_slope=0.01,
     thermal_spikes=None,
     power_events=None,
-    burst_params=None
+    burst_params=None,
+    seed=None,
+    oscillator_noise=None
 ):
     t = np.arange(0, length, sampling_rate)
-    drift = np.zeros_like(t, dtype=float)
-    if profile_type == "slow_sine":
-        drift = (
-            sine_amplitude * np.sin(sine_freq * t) +
-            np.random.normal(0, noise_std, len(t)) +
-            drift_slope * t
-        )
-    elif profile_type == "burst":
-        drift = np.random.normal(0, noise_std, len(t)) + drift_slope * t
-        if burst_params:
-            start = burst_params.get("start", 0)
-            duration = burst_params.get("duration", 10)
-            magnitude = burst_params.get("magnitude", 20)
-            end = min(start + duration, len(drift))
-            drift[start:end] += magnitude
-    elif profile_type == "ramp":
-        drift = drift_slope * t + np.random.normal(0, noise_std, len(t))
-    else:
-        drift = (
-            sine_amplitude * np.sin(sine_freq * t) +
-            np.random.normal(0, noise_std, len(t)) +
-            drift_slope * t
-        )
-    if thermal_spikes:
-        for start, duration, magnitude in thermal_spikes:
-            end = min(start + duration, len(drift))
-            drift[start:end] += magnitude
-    if power_events:
-        for idx, offset in power_events:
-            if 0 <= idx < len(drift):
-                drift[idx:] += offset
-    drift = np.maximum(drift, -70.0)
+    rng = np.random if seed is None else np.random.default_rng(seed)
+    drift = _profile_chunk(rng, t, profile_type, sine_amplitude, sine_freq, noise_std, drift_slope)
+    noise_model = resolve_noise_model(oscillator_noise, sampling_rate)
+    if noise_model is not None:
+        drift += noise_model.generate_ppm(len(t), rng)
+    drift = _apply_events(drift, 0, len(t), profile_type, thermal_spikes, power_events, burst_params)
     std = np.std(drift)
     if std > 1.0:
         mean = np.mean(drift)
         drift = mean + (drift - mean) * (1.0 / std)
     return drift  
+def iter_drift_profile(
+    length,
+    sampling_rate=1,
+    profile_type="slow_sine",
+    sine_amplitude=5,
+    sine_freq=0.01,
+    noise_std=0.5,
+    drift_slope=0.01,
+    thermal_spikes=None,
+    power_events=None,
+    burst_params=None,
+    seed=None,
+    chunk_size=PROFILE_CHUNK_SIZE,
+    normalize=True
+):
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    total = max(0, math.ceil(length / sampling_rate))
+    def raw_chunks():
+        rng = np.random.default_rng(seed)
+        for start in range(0, total, chunk_size):
+            t = np.arange(start, min(start + chunk_size, total)) * sampling_rate
+            drift = _profile_chunk(rng, t, profile_type, sine_amplitude, sine_freq, noise_std, drift_slope)
+            yield _apply_events(drift, start, total, profile_type, thermal_spikes, power_events, burst_params)
+    scale = None
+    if normalize and total:
+        count, mean, m2 = 0, 0.0, 0.0
+        for chunk in raw_chunks():
+            n = len(chunk)
+            chunk_mean = float(chunk.mean())
+            delta = chunk_mean - mean
+            m2 += float(np.sum((chunk - chunk_mean) ** 2)) + delta * delta * count * n / (count + n)
+            count += n
+            mean += delta * n / count
+        std = math.sqrt(m2 / count)
+        if std > 1.0:
+            scale = 1.0 / std
+    for chunk in raw_chunks():
+        yield chunk if scale is None else mean + (chunk - mean) * scale
+CLOCK_CHUNK_SIZE = 1 << 16
+def _clock_offsets(drift_ppm, compensation, sampling_rate, inverse):
+    offsets = np.asarray(drift_ppm, dtype=float) * (sampling_rate * (-1e-6 if inverse else 1e-6))
+    if compensation is not None:
+        comp = np.asarray(compensation, dtype=float)[:len(offsets)]
+        offsets[:len(comp)] += comp
+    return offsets
+def _compensated_cumsum(values, total=0.0, error=0.0, block=4096):
+    out = np.empty(len(values))
+    for start in range(0, len(values), block):
+        partial = np.cumsum(values[start:start + block])
+        out[start:start + block] = total + (partial + error)
+        step = float(partial[-1])
+        t = total + step
+        if abs(total) >= abs(step):
+            error += (total - t) + step
+        else:
+            error += (step - t) + total
+        total = t
+    return out, total, error
+def iter_drift_to_clock(
+    drift_profile,
+    initial_time=0.0,
+    compensation_profile=None,
+    sampling_rate=1,
+    inverse=False,
+    chunk_size=CLOCK_CHUNK_SIZE
+):
+    if isinstance(drift_profile, (np.ndarray, list, tuple)):
+        drift_profile = np.asarray(drift_profile, dtype=float)
+        chunks = (drift_profile[start:start + chunk_size] for start in range(0, len(drift_profile), chunk_size))
+    else:
+        chunks = drift_profile
+    emitted = 0
+    total = 0.0
+    error = 0.0
+    for chunk in chunks:
+        n = len(chunk)
+        comp = None
+        if compensation_profile is not None:
+            comp = compensation_profile[emitted:emitted + n]
+        offsets, total, error = _compensated_cumsum(_clock_offsets(chunk, comp, sampling_rate, inverse), total, error)
+        emitted += n
+        ticks = np.arange(emitted - n + 1, emitted + 1) * float(sampling_rate)
+        yield initial_time + ticks + offsets
 def apply_drift_to_clock(
     drift_profile,
     initial_time=0.0,
@@ -89,26 +172,22 @@ def apply_drift_to_clock(
     inverse=False,
     allow_mismatch=False
 ):
-    logical_clock = initial_time
-    logical_clock_trace = []
+    drift_profile = np.asarray(drift_profile, dtype=float)
     n = len(drift_profile)
     comp = compensation_profile if compensation_profile is not None else None
     if comp is not None and not allow_mismatch and len(comp) != n:
         raise ValueError("compensation_profile length must match drift_profile length")
-    for i, drift_ppm in enumerate(drift_profile):
-        drift_factor = (1 + drift_ppm * 1e-6) if not inverse else (1 - drift_ppm * 1e-6)
-        logical_clock += sampling_rate * drift_factor
-        if comp is not None:
-            if i < len(comp):
-                logical_clock += comp[i]
-            elif allow_mismatch:
-                logical_clock += 0
-        logical_clock_trace.append(logical_clock)
-    return np.array(logical_clock_trace)
-def simulate_drift(elapsed_time, factor=1.0, temp=25.0, stability=0.0001):
+    if n == 0:
+        return np.array([])
+    offsets, _, _ = _compensated_cumsum(_clock_offsets(drift_profile, comp, sampling_rate, inverse))
+    return initial_time + np.arange(1, n + 1) * float(sampling_rate) + offsets
+def simulate_drift(elapsed_time, factor=1.0, temp=25.0, stability=0.0001, oscillator_noise=None):
     base_drift = stability * elapsed_time
     temp_effect = 0.0005 * (temp - 25)**2 * elapsed_time / 1e6
     random_walk = np.random.normal(0, 0.1 * np.sqrt(elapsed_time))
+    noise_model = resolve_noise_model(oscillator_noise)
+    if noise_model is not None and elapsed_time > 0:
+        random_walk += np.random.normal(0, elapsed_time * float(noise_model.adev(elapsed_time)))
     aging = 0.01 * np.log(1 + elapsed_time / 3600)
     return factor * (base_drift + temp_effect + random_walk + aging)
 class CompensatedClock:
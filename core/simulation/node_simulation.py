@@ -42,10 +42,6 @@ import os
 import queue
 import threading
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 class VirtualNode:
     def __init__(self, node_id, base_drift=10, noise_level=0.5, 
                  compensation_interval=1.0, sync_interval=30.0, drift_trend=0.0):
@@ -146,4 +142,8 @@ def run_test_scenario():
             print("  ⚠️ Degraded operation mode activated")
     print("\nTest sequence completed")
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
     run_test_scenario()
\ No newline at end of file
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: oscillator_noise.py
+
+import numpy as np
+import math
+NOISE_TYPES = {
+    "white_pm": 2,
+    "flicker_pm": 1,
+    "white_fm": 0,
+    "flicker_fm": -1,
+    "random_walk_fm": -2
+}
+NODE_CLASSES = {
+    "ocxo": {"white_fm": 1e-12, "flicker_fm": 5e-13, "random_walk_fm": 1e-14},
+    "tcxo": {"white_pm": 1e-10, "white_fm": 1e-10, "flicker_fm": 1e-10, "random_walk_fm": 1e-12},
+    "xo": {"white_pm": 1e-9, "white_fm": 1e-9, "flicker_fm": 1e-9, "random_walk_fm": 1e-11},
+    "rc": {"white_fm": 1e-7, "flicker_fm": 1e-7, "random_walk_fm": 1e-9}
+}
+def _alpha(noise_type):
+    if noise_type in NOISE_TYPES:
+        return NOISE_TYPES[noise_type]
+    if noise_type in NOISE_TYPES.values():
+        return noise_type
+    raise ValueError(f"Unknown noise type: {noise_type}")
+def _adev_basis(alpha, taus, tau0):
+    taus = np.asarray(taus, dtype=float)
+    fh = 0.5 / tau0
+    if alpha == 2:
+        return 3.0 * fh / ((2 * np.pi) ** 2 * taus ** 2)
+    if alpha == 1:
+        return (1.038 + 3.0 * np.log(2 * np.pi * fh * taus)) / ((2 * np.pi) ** 2 * taus ** 2)
+    if alpha == 0:
+        return 0.5 / taus
+    if alpha == -1:
+        return np.full(taus.shape, 2.0 * math.log(2.0))
+    return (2 * np.pi) ** 2 * taus / 6.0
+def adev_to_h(noise_type, sigma, tau=1.0, tau0=1.0):
+    return float(sigma) ** 2 / float(_adev_basis(_alpha(noise_type), tau, tau0))
+def h_to_adev(noise_type, h, taus, tau0=1.0):
+    return np.sqrt(h * _adev_basis(_alpha(noise_type), taus, tau0))
+def _filter_kernel(alpha, n):
+    d = -alpha / 2.0
+    k = np.arange(1, n)
+    return np.concatenate(([1.0], np.cumprod((k - 1 + d) / k)))
+def power_law_noise(shape, noise_type, h=1.0, tau0=1.0, rng=None):
+    alpha = _alpha(noise_type)
+    rng = np.random.default_rng() if rng is None else rng
+    shape = (shape,) if np.isscalar(shape) else tuple(shape)
+    n = shape[-1]
+    scale = math.sqrt(h / (2.0 * (2 * np.pi) ** alpha * tau0 ** (alpha + 1)))
+    white = rng.standard_normal(shape) * scale
+    if alpha == 0 or n == 0:
+        return white
+    if alpha == -2:
+        return np.cumsum(white, axis=-1)
+    if alpha == 2:
+        return np.diff(white, axis=-1, prepend=0.0)
+    size = 1 << (2 * n - 1).bit_length()
+    spectrum = np.fft.rfft(white, size, axis=-1) * np.fft.rfft(_filter_kernel(alpha, n), size)
+    return np.fft.irfft(spectrum, size, axis=-1)[..., :n]
+class OscillatorNoiseModel:
+    def __init__(self, coefficients, tau0=1.0):
+        self.tau0 = float(tau0)
+        self.coefficients = {_alpha(key): float(h) for key, h in coefficients.items() if h > 0}
+    @classmethod
+    def from_adev(cls, components, tau0=1.0, tau=1.0):
+        return cls({key: adev_to_h(key, sigma, tau, tau0) for key, sigma in components.items()}, tau0)
+    @classmethod
+    def from_node_class(cls, node_class, tau0=1.0):
+        if node_class not in NODE_CLASSES:
+            raise ValueError(f"Unknown node class: {node_class}")
+        return cls.from_adev(NODE_CLASSES[node_class], tau0)
+    @classmethod
+    def fit(cls, taus, adev, tau0=1.0, noise_types=None):
+        from scipy.optimize import nnls
+        taus = np.asarray(taus, dtype=float)
+        adev = np.asarray(adev, dtype=float)
+        alphas = [_alpha(key) for key in (noise_types or NOISE_TYPES)]
+        basis = np.column_stack([_adev_basis(alpha, taus, tau0) for alpha in alphas])
+        weights = 1.0 / adev ** 2
+        h, _ = nnls(basis * weights[:, None], np.ones(len(taus)))
+        return cls(dict(zip(alphas, h)), tau0)
+    def adev(self, taus):
+        taus = np.asarray(taus, dtype=float)
+        variance = np.zeros(taus.shape)
+        for alpha, h in self.coefficients.items():
+            variance += h * _adev_basis(alpha, taus, self.tau0)
+        return np.sqrt(variance)
+    def generate(self, shape, rng=None, seed=None):
+        rng = np.random.default_rng(seed) if rng is None else rng
+        shape = (shape,) if np.isscalar(shape) else tuple(shape)
+        y = np.zeros(shape)
+        for alpha, h in sorted(self.coefficients.items()):
+            y += power_law_noise(shape, alpha, h, self.tau0, rng)
+        return y
+    def generate_ppm(self, shape, rng=None, seed=None):
+        return self.generate(shape, rng, seed) * 1e6
+def resolve_noise_model(noise, tau0=1.0):
+    if noise is None or isinstance(noise, OscillatorNoiseModel):
+        return noise
+    if isinstance(noise, str):
+        return OscillatorNoiseModel.from_node_class(noise, tau0)
+    return OscillatorNoiseModel.from_adev(noise, tau0)
+def generate_fleet_noise(node_classes, length, tau0=1.0, seed=None):
+    rng = np.random.default_rng(seed)
+    node_classes = list(node_classes)
+    out = np.empty((len(node_classes), length))
+    groups = {}
+    for idx, node_class in enumerate(node_classes):
+        key = node_class if isinstance(node_class, str) else idx
+        groups.setdefault(key, (node_class, []))[1].append(idx)
+    for node_class, rows in groups.values():
+        model = resolve_noise_model(node_class, tau0)
+        out[rows] = model.generate_ppm((len(rows), length), rng)
+    return out
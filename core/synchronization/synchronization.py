@@ -32,9 +32,10 @@
 
 import time
 import numpy as np
-from core.drift.drift_predictor import DriftPredictor
+from core.drift.drift_predictor import DriftPredictor, MIN_SELECTION_SAMPLES
+from core.drift.online_stats import SlidingWindowStats
 class TimeSynchronizer:
-    def __init__(self, node_id, sync_strategy='beacon', sync_interval=10):
+    def __init__(self, node_id, sync_strategy='beacon', sync_interval=10, residual_window=5):
         self.node_id = node_id
         self.drift_predictor = DriftPredictor()
         self.sync_strategy = sync_strategy
@@ -44,16 +45,52 @@ class TimeSynchronizer:
         self.stability_factor = 1.0
         self.drift_history = []
         self.residual_history = []
+        self.residual_stats = SlidingWindowStats(residual_window)
+    def reset(self):
+        self.drift_predictor.reset()
+        self.actual_sync_interval = self.base_sync_interval
+        self.stability_factor = 1.0
+        self.drift_history = []
+        self.residual_history = []
+        self.residual_stats.reset()
+    def get_state(self):
+        return {
+            'node_id': self.node_id,
+            'sync_interval': self.actual_sync_interval,
+            'stability_factor': self.stability_factor,
+            'last_drift': self.drift_history[-1] if self.drift_history else None,
+            'residuals': self.residual_stats.values(),
+            'predictor': self.drift_predictor.get_state()
+        }
+    def set_state(self, state):
+        if state['node_id'] != self.node_id:
+            raise ValueError(f"Checkpoint belongs to node {state['node_id']}")
+        self.reset()
+        self.drift_predictor.set_state(state['predictor'])
+        self.actual_sync_interval = state['sync_interval']
+        self.stability_factor = state['stability_factor']
+        if state['last_drift'] is not None:
+            self.drift_history.append(state['last_drift'])
+        for residual in state['residuals']:
+            self.residual_history.append(residual)
+            self.residual_stats.push(residual)
+    def save_checkpoint(self, path, temperature=None):
+        from core.drift.predictor_checkpoint import save_checkpoint
+        return save_checkpoint(path, self, temperature)
+    def restore_checkpoint(self, path, **validity):
+        from core.drift.predictor_checkpoint import restore_checkpoint
+        return restore_checkpoint(path, self, **validity)
     def get_corrected_time(self):
         local_time = time.time()
-        predicted_drift = self.drift_predictor.predict(local_time)
+        predicted_drift = self.drift_predictor.predict(timestamp=local_time)
         return local_time - predicted_drift
     def synchronize(self, reference_time, **sensor_data):
         local_time = time.time()
         current_drift = local_time - reference_time
-        self.drift_predictor.update(local_time, current_drift)
+        self.drift_predictor.update(current_drift, timestamp=local_time)
         residual = self.drift_predictor.get_residual()
         self.residual_history.append(residual)
+        self.residual_stats.push(residual)
         self.drift_history.append(current_drift)
         self._adapt_sync_interval()
         if sensor_data:
@@ -61,9 +98,9 @@ class TimeSynchronizer:
         self.last_sync_time = local_time
         return residual
     def _adapt_sync_interval(self):
-        if len(self.residual_history) < 5:
+        if self.residual_stats.count < self.residual_stats.window:
             return
-        residual_std = np.std(self.residual_history[-5:])
+        residual_std = self.residual_stats.std()
         if residual_std > 0.1:  
             self.actual_sync_interval = max(1, self.base_sync_interval * 0.5)
         elif residual_std > 0.01:  
@@ -73,6 +110,13 @@ class TimeSynchronizer:
         self.stability_factor = residual_std
     def _update_environmental_model(self, sensor_data):
         pass
+    def safe_holdover_steps(self, max_offset, interval=None, confidence=3.0, horizon=3600):
+        if len(self.drift_predictor.drifts) < MIN_SELECTION_SAMPLES:
+            return 0
+        interval = self.actual_sync_interval if interval is None else interval
+        _, variance = self.drift_predictor.forecast(horizon, interval=interval)
+        exceeded = confidence * np.sqrt(variance) > max_offset
+        return int(np.argmax(exceeded)) if exceeded.any() else len(exceeded)
     def should_sync(self):
         return (time.time() - self.last_sync_time) >= self.actual_sync_interval
     def get_sync_parameters(self):
@@ -30,13 +30,26 @@
 
 # File: plot_drift.py
 
-import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
 import os
 import glob
 import json
+from core.drift.binary_log import read_binary_log
+from core.drift.log_rotation import select_segments
+def load_drift_log(path, start=None, end=None):
+    import pandas as pd
+    if path.endswith('.bin'):
+        df = pd.DataFrame(read_binary_log(path))
+        df.insert(0, 'timestamp', pd.to_datetime(df.pop('timestamp_ns'), unit='ns'))
+        return df
+    if path.endswith('_manifest.json'):
+        segments = select_segments(path, start, end)
+        if not segments:
+            raise ValueError(f"{path}: no segments in the requested range")
+        return pd.concat([pd.read_csv(segment) for segment in segments], ignore_index=True)
+    return pd.read_csv(path)
 def compute_summary(df, filename):
+    import pandas as pd
     duration = df['monotonic'].max() - df['monotonic'].min()
     mean_ppm = df['drift_ppm'].mean()
     stddev_ppm = df['drift_ppm'].std()
@@ -68,26 +81,31 @@ def print_summary_table(summaries):
     for s in summaries:
         print(" | ".join(f"{str(s[k]):>14}" for k in keys))
 def analyze_and_plot():
-    log_files = glob.glob('logs/drift_*.csv')
+    import matplotlib.pyplot as plt
+    manifests = glob.glob('logs/drift_*_manifest.json')
+    segmented = tuple(m[:-len('_manifest.json')] + '_' for m in manifests)
+    log_files = [f for f in glob.glob('logs/drift_*.csv') if not f.startswith(segmented)]
+    log_files += glob.glob('logs/drift_*.bin') + manifests
     if not log_files:
         print("No drift logs found. Run drift_collector first.")
         return
     summaries = []
     for log in sorted(log_files):
         try:
-            df = pd.read_csv(log)
+            df = load_drift_log(log)
             summary = compute_summary(df, log)
             summaries.append(summary)
         except Exception as e:
             print(f"Could not process {log}: {e}")
     print_summary_table(summaries)
     latest_log = max(log_files, key=os.path.getctime)
-    df = pd.read_csv(latest_log)
+    df = load_drift_log(latest_log)
     print(f"\nAnalyzing: {latest_log}")
     print(f"Total samples: {len(df)}")
     print(f"Time duration: {df['monotonic'].max() - df['monotonic'].min():.2f} seconds")
     summary = compute_summary(df, latest_log)
-    summary_file = latest_log.replace('.csv', '_summary.json')
+    log_base = latest_log[:-len('_manifest.json')] if latest_log.endswith('_manifest.json') else os.path.splitext(latest_log)[0]
+    summary_file = log_base + '_summary.json'
     with open(summary_file, 'w') as f:
         json.dump(summary, f, indent=2)
     print(f"Summary saved to: {summary_file}")
@@ -124,7 +142,7 @@ def analyze_and_plot():
     plt.ylabel('Correlation')
     plt.grid(True)
     plt.tight_layout()
-    plot_file = latest_log.replace('.csv', '_analysis.png')
+    plot_file = log_base + '_analysis.png'
     plt.savefig(plot_file)
     print(f"Analysis saved to: {plot_file}")
     plt.show()
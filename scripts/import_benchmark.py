@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: import_benchmark.py
+
+import argparse
+import statistics
+import subprocess
+import sys
+import os
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+BASELINE_MODULE = "numpy"
+IMPORT_BUDGET_MS = {
+    "core.hal": 20,
+    "core.drift.drift_predictor": 30,
+    "core.drift.drift_collector": 60,
+    "core.drift.spectral_decomposition": 30,
+    "core.synchronization.synchronization": 30,
+    "core.synchronization.beacon_synchronization": 30,
+    "core.fingerprint.temporal_fingerprint": 30,
+    "core.validation.validate_tmb": 40,
+    "core.simulation.clock_drift_model": 30,
+    "core.simulation.oscillator_noise": 30
+}
+FORBIDDEN_MODULES = ("scipy", "pandas", "matplotlib", "pywt")
+def measure_import(module, repeats=5):
+    code = (
+        "import sys, time\n"
+        "t = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - t\n"
+        f"heavy = sorted(m for m in {FORBIDDEN_MODULES!r} if m in sys.modules)\n"
+        "print(elapsed * 1e3, ','.join(heavy))\n"
+    )
+    samples = []
+    heavy = ""
+    for _ in range(repeats):
+        result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+        fields = result.stdout.split()
+        samples.append(float(fields[0]))
+        heavy = fields[1] if len(fields) > 1 else ""
+    return statistics.median(samples), heavy
+def run_benchmark(repeats=5, slack=1.0):
+    baseline_ms, _ = measure_import(BASELINE_MODULE, repeats)
+    print(f"Baseline: import {BASELINE_MODULE} = {baseline_ms:.1f} ms")
+    print(f"{'module':<48} {'import ms':>10} {'over base':>10} {'budget':>8}  status")
+    failures = 0
+    for module, budget in IMPORT_BUDGET_MS.items():
+        elapsed_ms, heavy = measure_import(module, repeats)
+        overhead_ms = max(0.0, elapsed_ms - baseline_ms)
+        ok = overhead_ms <= budget * slack and not heavy
+        failures += not ok
+        status = "OK" if ok else "OVER BUDGET"
+        if heavy:
+            status += f" (pulled in {heavy})"
+        print(f"{module:<48} {elapsed_ms:>10.1f} {overhead_ms:>10.1f} {budget:>8}  {status}")
+    return failures
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import-time budget check for the core package")
+    parser.add_argument("--repeats", type=int, default=5, help="Cold imports per module (median is reported)")
+    parser.add_argument("--slack", type=float, default=1.0, help="Multiplier applied to every budget")
+    args = parser.parse_args()
+    failures = run_benchmark(args.repeats, args.slack)
+    if failures:
+        print(f"{failures} module(s) over their import budget")
+        exit(1)
+    print("All modules within import budget")
@@ -30,10 +30,48 @@
 
 # File: oscillator_characterization.py
 
+import csv
 import time
 import argparse
+import numpy as np
 from core.hal import HardwareAbstractionLayer
 from core.visualization import plot_drift
+from core.drift.allan_deviation import phase_deviations
+from core.drift.thermal_calibration import ThermalCalibration
+from core.drift.thermal_model import fit_thermal_calibration
+def calibrate_thermal(results, clock_source, degree=2):
+    t = np.array([r['t'] for r in results])
+    phase = np.array([r['drift'] for r in results])
+    temps = np.array([r['temp'] for r in results])
+    drift_ppm = np.diff(phase) / np.diff(t) * 1e6
+    if np.ptp(temps) > 1.0:
+        calibration = fit_thermal_calibration(t[1:], temps[1:], drift_ppm, degree, clock_source)
+        print(f"Thermal lag {calibration.time_constant:.1f}s, hysteresis {calibration.hysteresis:.2f}°C")
+    else:
+        calibration = ThermalCalibration.fit(temps[1:], drift_ppm, degree=degree, clock_source=clock_source)
+    path = calibration.save()
+    print(f"Thermal coefficients for {clock_source}: {calibration.coefficients.tolist()} "
+          f"(rms residual {calibration.rms_residual:.4f} ppm)")
+    print(f"Thermal calibration saved to: {path}")
+    return calibration
+def emit_allan_curves(curve, name):
+    print(f"{'tau (s)':>12} {'ADEV':>12} {'MDEV':>12} {'TDEV (s)':>12} {'terms':>10}")
+    for tau, adev, mdev, tdev, terms in zip(curve['tau'], curve['adev'], curve['mdev'], curve['tdev'], curve['adev_terms']):
+        print(f"{tau:>12.4g} {adev:>12.3e} {mdev:>12.3e} {tdev:>12.3e} {terms:>10}")
+    csv_file = f"{name}_adev.csv"
+    with open(csv_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['tau', 'adev', 'mdev', 'tdev', 'adev_terms', 'mdev_terms'])
+        writer.writerows(zip(*(curve[k].tolist() for k in ('tau', 'adev', 'mdev', 'tdev', 'adev_terms', 'mdev_terms'))))
+    print(f"Allan deviation curves saved to: {csv_file}")
+    return csv_file
+def characterize_log(path):
+    df = plot_drift.load_drift_log(path)
+    tau0 = float(np.median(np.diff(df['monotonic'].to_numpy())))
+    print(f"Analyzing {len(df)} samples from {path} (tau0={tau0:.6g}s)")
+    curve = phase_deviations((df['monotonic'] - df['perf_counter']).to_numpy(dtype=float), tau0)
+    emit_allan_curves(curve, path.rsplit('.', 1)[0])
+    return curve
 def characterize_oscillator(hal, duration=3600, mode="WSL"):
     print(f"Starting oscillator characterization in {mode} mode for {duration} seconds...")
     results = []
@@ -60,12 +98,21 @@ def characterize_oscillator(hal, duration=3600, mode="WSL"):
         plot_drift.generate_report(results, "oscillator_characterization")
     else:
         print("Warning: plot_drift.generate_report not implemented. Skipping report generation.")
+    if len(results) > 3:
+        tau0 = float(np.median(np.diff([r['t'] for r in results])))
+        emit_allan_curves(phase_deviations([r['drift'] for r in results], tau0), "oscillator_characterization")
     print("Oscillator characterization complete. Report generated.")
     return results
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Oscillator Characterization Script")
     parser.add_argument("--duration", type=int, default=3600, help="Duration of the test in seconds")
+    parser.add_argument("--calibrate", action="store_true", help="Fit and save the thermal calibration for this clock source")
+    parser.add_argument("--degree", type=int, default=2, help="Polynomial degree of the thermal calibration")
+    parser.add_argument("--log", help="Compute ADEV/MDEV/TDEV curves from an existing drift log instead of measuring")
     args = parser.parse_args()
+    if args.log:
+        characterize_log(args.log)
+        exit(0)
     if args.duration <= 0:
         print("Error: Duration must be a positive integer.")
         exit(1)
@@ -76,4 +123,6 @@ if __name__ == "__main__":
         exit(1)
     print("Starting oscillator characterization...")
     results = characterize_oscillator(hal, duration=args.duration)
+    if args.calibrate:
+        calibrate_thermal(results, hal.sensors.get('clock_source', 'default'), args.degree)
     print("Characterization results:", results[:5])  
\ No newline at end of file
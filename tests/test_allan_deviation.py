@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: test_allan_deviation.py
+
+import math
+import numpy as np
+import pytest
+from core.drift.allan_deviation import StreamingAllanDeviation, drift_deviations, frequency_deviations, phase_deviations
+def _brute_force(x, m, tau0):
+    tau = m * tau0
+    d = np.array([x[i + 2 * m] - 2.0 * x[i + m] + x[i] for i in range(len(x) - 2 * m)])
+    adev = math.sqrt(np.mean(d * d) / (2.0 * tau * tau))
+    inner = np.array([d[j:j + m].sum() for j in range(len(d) - m + 1)])
+    mdev = math.sqrt(np.mean(inner * inner) / (2.0 * m * m * tau * tau))
+    return adev, mdev
+def test_phase_deviations_match_definition():
+    rng = np.random.default_rng(1)
+    x = np.cumsum(rng.normal(0.0, 1e-9, 600))
+    curve = phase_deviations(x, 0.1, [1, 2, 4, 8, 16])
+    for i, m in enumerate(curve['tau'] / 0.1):
+        adev, mdev = _brute_force(x, int(round(m)), 0.1)
+        assert curve['adev'][i] == pytest.approx(adev, rel=1e-12)
+        assert curve['mdev'][i] == pytest.approx(mdev, rel=1e-12)
+    np.testing.assert_allclose(curve['tdev'], curve['tau'] * curve['mdev'] / math.sqrt(3.0), rtol=1e-15)
+@pytest.mark.parametrize("octaves", [1, 6, 10])
+def test_streaming_matches_batch(octaves):
+    rng = np.random.default_rng(2)
+    drift_ppm = 3.0 + np.cumsum(rng.normal(0.0, 0.01, 5000)) + rng.normal(0.0, 0.2, 5000)
+    streaming = StreamingAllanDeviation(0.1, octaves)
+    for value in drift_ppm:
+        streaming.push(value)
+    live = streaming.deviations()
+    batch = drift_deviations(drift_ppm, 0.1, streaming.factors)
+    for key in ('adev', 'mdev', 'tdev'):
+        np.testing.assert_allclose(live[key], batch[key], rtol=1e-9, equal_nan=True)
+    np.testing.assert_array_equal(live['adev_terms'], batch['adev_terms'])
+    np.testing.assert_array_equal(live['mdev_terms'], batch['mdev_terms'])
+def test_frequency_and_phase_paths_agree():
+    rng = np.random.default_rng(3)
+    y = rng.normal(0.0, 1e-8, 2000)
+    tau0 = 0.5
+    x = np.concatenate(([0.0], np.cumsum(y) * tau0))
+    via_frequency = frequency_deviations(y, tau0)
+    via_phase = phase_deviations(x, tau0, via_frequency['tau'] / tau0)
+    np.testing.assert_allclose(via_frequency['adev'], via_phase['adev'], rtol=1e-9)
+def test_white_fm_slope():
+    rng = np.random.default_rng(4)
+    curve = frequency_deviations(rng.normal(0.0, 1e-9, 1 << 16), 1.0, [1, 4, 16, 64])
+    expected = 1e-9 / np.sqrt(curve['tau'])
+    np.testing.assert_allclose(curve['adev'], expected, rtol=0.1)
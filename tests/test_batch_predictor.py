@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: test_batch_predictor.py
+
+import numpy as np
+import pytest
+from core.drift.drift_predictor import DriftPredictor
+def _series(n=4000, seed=11):
+    rng = np.random.default_rng(seed)
+    walk = np.cumsum(rng.normal(0.0, 0.3, n))
+    noise = rng.normal(0.0, 0.5, n)
+    mixed = np.where((np.arange(n) // 400) % 2 == 0, walk, noise + 0.002 * np.arange(n))
+    return mixed, np.arange(n, dtype=float) * 0.5
+@pytest.mark.parametrize("model_type", ['ar1', 'kalman'])
+@pytest.mark.parametrize("timed", [False, True])
+def test_update_many_matches_streaming(model_type, timed):
+    z, t = _series()
+    timestamps = t if timed else None
+    batch = DriftPredictor(model_type=model_type)
+    predictions, residuals = batch.update_many(z, timestamps)
+    stream = DriftPredictor(model_type=model_type)
+    expected = np.empty(len(z))
+    expected_residuals = np.empty(len(z))
+    for i, value in enumerate(z):
+        stream.update(value, None if timestamps is None else timestamps[i])
+        expected[i] = stream.last_prediction
+        expected_residuals[i] = stream.get_residual()
+    np.testing.assert_allclose(predictions, expected, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(residuals, expected_residuals, rtol=0, atol=1e-12)
+    assert batch.dynamic_model == stream.dynamic_model
+    assert batch.predict(3) == pytest.approx(stream.predict(3), abs=1e-12)
+@pytest.mark.parametrize("model_type", ['ar1', 'kalman'])
+@pytest.mark.parametrize("steps", [1, 3])
+def test_predict_many_matches_streaming(model_type, steps):
+    z, t = _series(1500)
+    ahead = t + steps * 0.5
+    batch = DriftPredictor(model_type=model_type)
+    predictions, residuals = batch.predict_many(z, t, steps, ahead)
+    stream = DriftPredictor(model_type=model_type)
+    expected = np.empty(len(z))
+    for i, value in enumerate(z):
+        stream.update(value, t[i])
+        expected[i] = stream.predict(steps, ahead[i])
+    np.testing.assert_allclose(predictions, expected, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(residuals[:-steps], z[steps:] - expected[:-steps], rtol=0, atol=1e-12)
+    assert np.all(np.isnan(residuals[-steps:]))
+def test_update_many_continues_a_warm_predictor():
+    z, t = _series(3000)
+    batch = DriftPredictor(model_type='kalman')
+    stream = DriftPredictor(model_type='kalman')
+    for i in range(500):
+        batch.update(z[i], t[i])
+        stream.update(z[i], t[i])
+    predictions, _ = batch.update_many(z[500:], t[500:])
+    expected = []
+    for i in range(500, len(z)):
+        stream.update(z[i], t[i])
+        expected.append(stream.last_prediction)
+    np.testing.assert_allclose(predictions, expected, rtol=0, atol=1e-12)
+    assert batch.dynamic_model == stream.dynamic_model
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: test_drift_predictor.py
+
+import numpy as np
+from core.drift.drift_predictor import DriftPredictor
+def _ar1_series(rng, phi, mean, sigma, n):
+    x = np.empty(n)
+    x[0] = mean
+    for i in range(1, n):
+        x[i] = mean + phi * (x[i - 1] - mean) + rng.normal(0.0, sigma)
+    return x
+def test_ar1_forecast_stays_bounded():
+    rng = np.random.default_rng(7)
+    for _ in range(24):
+        predictor = DriftPredictor()
+        for value in _ar1_series(rng, 0.995, 5.0, 0.05, 400):
+            predictor.update(value)
+        predictor.dynamic_model = 'ar1'
+        mean, variance = predictor.forecast(3600)
+        assert np.all(np.isfinite(mean)) and np.all(np.isfinite(variance))
+        window = np.array(predictor.drifts)
+        assert np.all(np.abs(mean - window.mean()) <= np.ptp(window) + 1e-9)
+        assert np.all(np.diff(variance) >= -1e-15)
+        assert variance[-1] < 1e3 * variance[0]
+def test_ar1_forecast_reverts_to_window_mean():
+    predictor = DriftPredictor()
+    for value in _ar1_series(np.random.default_rng(3), 0.95, 5.0, 0.05, 200):
+        predictor.update(value)
+    predictor.dynamic_model = 'ar1'
+    mean, _ = predictor.forecast(3600)
+    assert abs(mean[-1] - np.mean(predictor.drifts)) < 1e-9
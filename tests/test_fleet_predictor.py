@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: test_fleet_predictor.py
+
+import numpy as np
+import pytest
+from core.drift.drift_predictor import DriftPredictor
+from core.drift.fleet_predictor import FleetDriftPredictor
+def _fleet_series(nodes=6, n=1200, seed=5):
+    rng = np.random.default_rng(seed)
+    walk = np.cumsum(rng.normal(0.0, 0.3, (nodes, n)), axis=1)
+    noise = rng.normal(0.0, 0.5, (nodes, n)) + 0.002 * np.arange(n)
+    return np.where((np.arange(nodes) % 2 == 0)[:, None], walk, noise)
+@pytest.mark.parametrize("model_type", ['ar1', 'kalman'])
+def test_fleet_matches_per_node_predictors(model_type):
+    z = _fleet_series()
+    nodes, n = z.shape
+    fleet = FleetDriftPredictor(nodes, model_type=model_type)
+    predictors = [DriftPredictor(model_type=model_type) for _ in range(nodes)]
+    for k in range(n):
+        t = float(k)
+        fleet.update(z[:, k], t)
+        for i, predictor in enumerate(predictors):
+            predictor.update(z[i, k], t)
+        expected = [p.last_prediction for p in predictors]
+        np.testing.assert_allclose(fleet.last_prediction, expected, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(fleet.predict(3), [p.predict(3) for p in predictors], rtol=0, atol=1e-12)
+        np.testing.assert_allclose(fleet.predict(1, t + 2.0), [p.predict(1, t + 2.0) for p in predictors], rtol=0, atol=1e-12)
+        np.testing.assert_allclose(fleet.get_residuals(), [p.get_residual() for p in predictors], rtol=0, atol=1e-12)
+    assert [fleet.node(i).dynamic_model for i in range(nodes)] == [p.dynamic_model for p in predictors]
+def test_default_node_view_matches_default_predictor():
+    z = _fleet_series(nodes=1)[0]
+    view = FleetDriftPredictor(1).node(0)
+    predictor = DriftPredictor()
+    for k, value in enumerate(z):
+        view.update(value, float(k))
+        predictor.update(value, float(k))
+        assert view.last_prediction == pytest.approx(predictor.last_prediction, abs=1e-12)
+    assert view.dynamic_model == predictor.dynamic_model
+    assert view.drifts == pytest.approx(list(predictor.drifts), abs=0)
+def test_masked_nodes_are_left_untouched():
+    z = _fleet_series(nodes=3, n=200)
+    fleet = FleetDriftPredictor(3)
+    predictors = [DriftPredictor() for _ in range(3)]
+    for k in range(z.shape[1]):
+        values = z[:, k].copy()
+        if k % 3 == 0:
+            values[1] = np.nan
+        fleet.update(values)
+        for i, predictor in enumerate(predictors):
+            if not np.isnan(values[i]):
+                predictor.update(values[i])
+    np.testing.assert_allclose(fleet.last_prediction, [p.last_prediction for p in predictors], rtol=0, atol=1e-12)
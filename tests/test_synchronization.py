@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# ZERO ARCHITECTURE - PRE-DEVELOPMENT BENCHMARKING
+# -------------------------------------------------
+# THIS IS NOT PRODUCTION CODE - HARDWARE RESEARCH ONLY
+#
+# MIT License
+#
+# Copyright (c) 2025 Salik Ridwan
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# WARNING: Experimental hardware interactions
+# -------------------------------------------------
+
+# File: test_synchronization.py
+
+import numpy as np
+from core.drift.drift_predictor import MIN_SELECTION_SAMPLES
+from core.synchronization.synchronization import TimeSynchronizer
+def _synchronizer_with_forecast(variance):
+    sync = TimeSynchronizer(node_id=1)
+    for i in range(MIN_SELECTION_SAMPLES):
+        sync.drift_predictor.update(0.0, timestamp=float(i))
+    sync.drift_predictor.forecast = lambda horizon, timestamps=None, interval=None: (np.zeros(horizon), variance[:horizon])
+    return sync
+def test_holdover_bounds_offset_spread_directly():
+    k = np.arange(1, 3601, dtype=float)
+    sync = _synchronizer_with_forecast((1e-4) ** 2 * k)
+    assert sync.safe_holdover_steps(3.01e-3, confidence=3.0) == 100
+    assert sync.safe_holdover_steps(3.1e-4, confidence=3.0) == 1
+    assert sync.safe_holdover_steps(1e-4, confidence=3.0) == 0
+def test_holdover_caps_at_horizon():
+    sync = _synchronizer_with_forecast(np.full(3600, 1e-12))
+    assert sync.safe_holdover_steps(1e-3, horizon=3600) == 3600
+def test_holdover_refuses_without_samples():
+    sync = TimeSynchronizer(node_id=1)
+    sync.drift_predictor.update(12.0, timestamp=0.0)
+    assert sync.safe_holdover_steps(1.0) == 0
+def test_holdover_tracks_random_walk_offsets():
+    rng = np.random.default_rng(0)
+    step = 2e-4
+    offsets = np.cumsum(rng.normal(0.0, step, 500))
+    sync = TimeSynchronizer(node_id=1)
+    for i, offset in enumerate(offsets):
+        sync.drift_predictor.update(offset, timestamp=float(i))
+    _, variance = sync.drift_predictor.forecast(1, interval=1.0)
+    assert 0.5 * step < np.sqrt(variance[0]) < 2.0 * step
+    assert sync.safe_holdover_steps(1e-4, interval=1.0) == 0
+    assert 0 < sync.safe_holdover_steps(1e-3, interval=1.0) < 3600